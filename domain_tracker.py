@@ -4,11 +4,19 @@ Domain Sales Tracker for Unstoppable Domains Partner Pages
 Scrapes partner landing pages to track domain sales status
 """
 
-from bs4 import BeautifulSoup
+import asyncio
+import hashlib
 import json
+import os
+import queue
+import threading
 import time
-from datetime import datetime
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from datetime import datetime, date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 import re
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -18,27 +26,245 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
+import aiohttp
+from aiolimiter import AsyncLimiter
+from selectolax.lexbor import LexborHTMLParser
 
 # Import partner URLs configuration
 from partner_urls import get_all_urls
 
+from json_io import dumps
+
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Scraped pages are cached on disk, keyed by URL and day
+CACHE_DIR = Path('.cache/scraper')
+CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Returns just the rendered cards, so the whole DOM isn't serialised over the driver connection
+_CARDS_HTML_JS = "return Array.from(document.querySelectorAll('div.domain-card')).map(e => e.outerHTML).join('');"
+
+_PRICE_RE = re.compile(r'\$(\d+)')
+
+# Every field of a domain card, matched in one walk of the card subtree
+_CARD_FIELDS_SELECTOR = 'div.domain-slug, strong.domain-ending, button.add-to-cart, div.price'
+
+# Requests that never contribute to the domain cards: static assets plus
+# third-party analytics, tag managers and ad trackers
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.woff*', '*.css',
+    '*google-analytics*', '*googletagmanager.com*', '*doubleclick*',
+    '*segment.io*', '*segment.com*', '*hotjar*', '*fullstory*',
+    '*optimizely*', '*facebook.net*',
+]
+
+
+def _card_count_stable():
+    """WebDriverWait condition: the number of domain cards stopped changing between two polls"""
+    last_count = [None]
+    
+    def condition(driver):
+        count = len(driver.find_elements(By.CLASS_NAME, 'domain-card'))
+        stable = count > 0 and count == last_count[0]
+        last_count[0] = count
+        return stable
+    
+    return condition
+
+
+def _partner_name(url: str) -> str:
+    """Partner name is the last path segment of its page URL"""
+    parts = url.rstrip('/').split('/')
+    return parts[-1] or parts[-2]
+
+
+async def _fetch(session: aiohttp.ClientSession, url: str, sem: asyncio.Semaphore, limiter: AsyncLimiter,
+                 validator: Optional[Dict] = None) -> Tuple[str, Dict]:
+    """Fetch the raw page HTML over plain HTTP (no browser)
+    
+    When a validator from an earlier run is given the request is conditional,
+    and a 304 Not Modified answer reuses the body stored with it.
+    
+    Returns:
+        The page HTML and the validator to store for the next run
+    """
+    headers = {}
+    if validator:
+        if validator.get('etag'):
+            headers['If-None-Match'] = validator['etag']
+        if validator.get('last_modified'):
+            headers['If-Modified-Since'] = validator['last_modified']
+    
+    async with sem, limiter, session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
+        if response.status == 304 and validator:
+            return validator['body'], validator
+        response.raise_for_status()
+        html_content = await response.text()
+        return html_content, {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body': html_content
+        }
+
+
+def _parse_html(html_content: str, partner_name: str, partner_url: str, scan_time: str) -> Dict:
+    """Parse a partner page's HTML into the per-partner result dictionary"""
+    tree = LexborHTMLParser(html_content)
+    
+    # Find all domain cards
+    domain_cards = tree.css('div.domain-card')
+    print(f"   {partner_name}: found {len(domain_cards)} domain cards")
+    
+    # Check if this page has premium domains
+    has_premium_domains = len(domain_cards) > 0
+    
+    domains = []
+    sold_count = 0
+    total_count = len(domain_cards)
+    total_sold_value = 0
+    
+    for card in domain_cards:
+        domain_info = _extract_domain_info(card)
+        domains.append(domain_info)
+        
+        if domain_info['status'] == 'sold':
+            sold_count += 1
+            # Add to total sold value if price is available
+            if domain_info['price_numeric'] > 0:
+                total_sold_value += domain_info['price_numeric']
+    
+    # Calculate percentage sold
+    percentage_sold = (sold_count / total_count * 100) if total_count > 0 else 0
+    
+    print(f"   {partner_name}: {sold_count}/{total_count} sold ({percentage_sold:.1f}%)")
+    
+    return {
+        'partner': partner_name,
+        'url': partner_url,
+        'timestamp': scan_time,
+        'has_premium_domains': has_premium_domains,
+        'total_domains': total_count,
+        'sold_domains': sold_count,
+        'available_domains': total_count - sold_count,
+        'percentage_sold': round(percentage_sold, 2),
+        'total_sold_value': total_sold_value,
+        'domains': domains,
+        'needs_update': dict(DomainTracker._needs_update(percentage_sold, sold_count, total_count, has_premium_domains))
+    }
+
+
+def _extract_domain_info(card) -> Dict:
+    """Extract domain information from a domain card"""
+    try:
+        # Collect the first node of each field from a single query
+        fields = {}
+        for node in card.css(_CARD_FIELDS_SELECTOR):
+            if node.tag == 'div':
+                key = 'price' if 'price' in (node.attributes.get('class') or '').split() else 'slug'
+            else:
+                key = node.tag
+            fields.setdefault(key, node)
+        
+        # Get domain name
+        domain_slug = fields.get('slug')
+        domain_ending = fields.get('strong')
+        
+        domain_name = ""
+        if domain_slug and domain_ending:
+            domain_name = domain_slug.text().strip() + domain_ending.text().strip()
+        
+        # Check button status
+        button = fields.get('button')
+        raw_button_text = button.text().strip() if button else ""
+        button_text = raw_button_text.lower()
+        button_classes = (button.attributes.get('class') or '').split() if button else []
+        has_disabled = 'disabled' in button.attributes if button else False
+        
+        # Determine status based on button text first
+        if button_text == "sold":
+            status = "sold"
+        elif button_text == "coming soon":
+            status = "coming_soon"
+        elif button_text == "buy now":
+            status = "available"
+        elif button_text.startswith("available"):  # Handles "Available [date/time]"
+            status = "coming_soon"
+        else:
+            # Fallback: check if button has sold class and is disabled
+            is_sold_class = button and ('sold' in button_classes and has_disabled)
+            status = "sold" if is_sold_class else "available"
+        
+        # Get price
+        price_element = fields.get('price')
+        price = ""
+        price_numeric = 0
+        if price_element:
+            price_text = price_element.text().strip()
+            # Extract price using regex
+            price_match = _PRICE_RE.search(price_text)
+            if price_match:
+                digits = price_match.group(1)
+                price = f"${digits}"
+                price_numeric = int(digits)
+        
+        return {
+            'domain': domain_name,
+            'status': status,
+            'price': price,
+            'price_numeric': price_numeric,
+            'button_text': raw_button_text
+        }
+        
+    except Exception as e:
+        return {
+            'domain': 'Unknown',
+            'status': 'error',
+            'price': '',
+            'price_numeric': 0,
+            'error': str(e)
+        }
+
+
 class DomainTracker:
-    def __init__(self, delay_between_requests: float = 1.0, headless: bool = True):
+    def __init__(self, delay_between_requests: float = 1.0, headless: bool = True, max_concurrency: int = 8,
+                 browser_pool_size: int = 4, force_refresh: bool = False, requests_per_second: float = 10,
+                 blocked_url_patterns: Optional[List[str]] = None):
         """
         Initialize the domain tracker
         
         Args:
-            delay_between_requests: Delay in seconds between HTTP requests
+            delay_between_requests: Delay in seconds between page loads on each browser
             headless: Whether to run browser in headless mode
+            max_concurrency: Maximum number of concurrent HTTP fetches
+            browser_pool_size: Maximum number of Chrome drivers rendering pages in parallel
+            force_refresh: Ignore pages cached on disk and fetch everything again
+            requests_per_second: Rate limit shared by all concurrent HTTP fetches
+            blocked_url_patterns: URL patterns Chrome refuses to load (defaults to BLOCKED_URL_PATTERNS)
         """
         self.delay = delay_between_requests
-        self.driver = None
-        self._setup_selenium(headless)
+        self.headless = headless
+        self.max_concurrency = max_concurrency
+        self.browser_pool_size = browser_pool_size
+        self.force_refresh = force_refresh
+        self.requests_per_second = requests_per_second
+        self.blocked_url_patterns = BLOCKED_URL_PATTERNS if blocked_url_patterns is None else blocked_url_patterns
+        self._driver_pool = queue.Queue()
+        self._drivers = []
+        self._pool_lock = threading.Lock()
+        self._browser_executor = None
+        self._parse_executor = None
     
     def _setup_selenium(self, headless: bool):
-        """Setup Selenium WebDriver with WebDriver Manager"""
+        """Start a Selenium WebDriver with WebDriver Manager
+        
+        Only called when a page has to be rendered in a browser, so scans where
+        every page is served with its domain cards in the HTML never start Chrome.
+        """
         try:
             chrome_options = Options()
+            # Return from get() at DOMContentLoaded instead of waiting for every subresource
+            chrome_options.page_load_strategy = 'eager'
             if headless:
                 chrome_options.add_argument('--headless=new')  # Use new headless mode
             chrome_options.add_argument('--no-sandbox')
@@ -46,207 +272,272 @@ class DomainTracker:
             chrome_options.add_argument('--disable-gpu')
             chrome_options.add_argument('--window-size=1920,1080')
             # Add user agent to avoid detection
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            chrome_options.add_argument(f'--user-agent={USER_AGENT}')
             # Disable automation flags
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
             chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+            # Domain cards are plain text, so don't download images
+            chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
             
             # Use WebDriver Manager to automatically manage ChromeDriver
             service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # keep_alive reuses one persistent connection to chromedriver for every command
+            driver = webdriver.Chrome(service=service, options=chrome_options, keep_alive=True)
             
             # Remove webdriver property to avoid detection
-            self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
+                "userAgent": USER_AGENT
             })
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
-            self.driver.implicitly_wait(10)
+            # Skip static assets, analytics and ad trackers
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_url_patterns})
+            
+            # Explicit waits only: an implicit wait stalls every find_elements poll that matches nothing
+            driver.implicitly_wait(0)
             print("Selenium WebDriver initialized successfully")
+            return driver
         except Exception as e:
             print(f"Failed to initialize Selenium: {e}")
             raise Exception(f"Could not initialize WebDriver: {e}")
     
-    def __del__(self):
-        """Cleanup Selenium driver"""
-        if hasattr(self, 'driver') and self.driver:
-            self.driver.quit()
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        """Quit every Selenium driver started by this tracker"""
+        with self._pool_lock:
+            drivers = [d for d in self._drivers if d is not None]
+            self._drivers = []
+            self._driver_pool = queue.Queue()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing WebDriver: {e}")
+    
+    @contextmanager
+    def _checkout(self):
+        """Borrow a warm WebDriver from the pool, starting a new one while the pool is below size"""
+        with self._pool_lock:
+            start_new = self._driver_pool.empty() and len(self._drivers) < self.browser_pool_size
+            if start_new:
+                self._drivers.append(None)  # Reserve the slot while Chrome starts
+        
+        if start_new:
+            try:
+                driver = self._setup_selenium(self.headless)
+            except Exception:
+                with self._pool_lock:
+                    self._drivers.remove(None)
+                raise
+            with self._pool_lock:
+                self._drivers[self._drivers.index(None)] = driver
+        else:
+            driver = self._driver_pool.get()
+        
+        try:
+            yield driver
+        finally:
+            self._checkin(driver)
+    
+    def _checkin(self, driver):
+        """Return a WebDriver to the pool"""
+        self._driver_pool.put(driver)
+    
+    def _cache_path(self, url: str) -> Path:
+        """Cache file for a page scraped today"""
+        digest = hashlib.sha1(url.encode()).hexdigest()
+        return CACHE_DIR / f"{digest}_{date.today().isoformat()}.html"
+    
+    def _validator_path(self, url: str) -> Path:
+        """Sidecar holding the ETag/Last-Modified and body of the last HTTP fetch"""
+        digest = hashlib.sha1(url.encode()).hexdigest()
+        return CACHE_DIR / f"{digest}.http.json"
     
-    def scrape_partner_page(self, partner_url: str) -> Dict:
+    def _load_validator(self, url: str) -> Optional[Dict]:
+        """Return the stored validator for a URL, if any"""
+        if self.force_refresh:
+            return None
+        try:
+            with open(self._validator_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _store_validator(self, url: str, validator: Dict):
+        """Remember the validator so the next run can send a conditional GET"""
+        if not (validator.get('etag') or validator.get('last_modified')):
+            return
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(self._validator_path(url), 'w', encoding='utf-8') as f:
+                json.dump(validator, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"   Could not write page cache: {e}")
+    
+    def _cache_get(self, url: str) -> Optional[str]:
+        """Return the cached HTML for a URL if it is fresh enough"""
+        if self.force_refresh:
+            return None
+        path = self._cache_path(url)
+        try:
+            if time.time() - path.stat().st_mtime < CACHE_TTL_SECONDS:
+                return path.read_text(encoding='utf-8')
+        except OSError:
+            pass
+        return None
+    
+    def _cache_put(self, url: str, html_content: str):
+        """Store a successfully scraped page"""
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self._cache_path(url).write_text(html_content, encoding='utf-8')
+        except OSError as e:
+            print(f"   Could not write page cache: {e}")
+    
+    def _prune_cache(self):
+        """Remove cached pages that have expired"""
+        if not CACHE_DIR.is_dir():
+            return
+        cutoff = time.time() - CACHE_TTL_SECONDS
+        for path in CACHE_DIR.glob('*.html'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+    
+    async def scrape_partner_page_async(self, session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                                        limiter: AsyncLimiter, partner_name: str, partner_url: str,
+                                        scan_time: str) -> Dict:
         """
         Scrape a single partner page for domain information
         
+        The page is fetched over plain HTTP first; the browser is only used when
+        the served HTML does not already contain the domain cards.
+        
         Args:
+            session: Shared aiohttp session
+            sem: Semaphore bounding the number of concurrent fetches
+            limiter: Token bucket pacing fetches against the partner site
+            partner_name: Partner name derived from the URL
             partner_url: URL of the partner page to scrape
+            scan_time: ISO timestamp shared by every result of this scan
             
         Returns:
             Dictionary containing domain information for the partner
         """
         try:
-            # Extract partner name from URL
-            partner_name = partner_url.rstrip('/').split('/')[-1]
-            if not partner_name:  # Handle case where URL ends with /
-                partner_name = partner_url.rstrip('/').split('/')[-2]
-            
             print(f"Scanning {partner_name}...")
             
-            html_content = self._get_page_with_selenium(partner_url)
+            # Parsing runs on its own thread pool so it stays off the event loop
+            loop = asyncio.get_running_loop()
             
-            if not html_content:
-                return {
-                    'partner': partner_name,
-                    'url': partner_url,
-                    'error': "Failed to retrieve page content",
-                    'timestamp': datetime.now().isoformat(),
-                    'has_premium_domains': False
-                }
+            def parse(html):
+                return loop.run_in_executor(self._parse_executor, _parse_html, html, partner_name, partner_url, scan_time)
             
-            soup = BeautifulSoup(html_content, 'html.parser')
+            html_content = self._cache_get(partner_url)
+            if html_content is not None:
+                print(f"   {partner_name}: using cached page")
+                return await parse(html_content)
             
-            # Find all domain cards
-            domain_cards = soup.find_all('div', class_='domain-card')
-            print(f"   Found {len(domain_cards)} domain cards")
-            
-            # Check if this page has premium domains
-            has_premium_domains = len(domain_cards) > 0
-            
-            domains = []
-            sold_count = 0
-            total_count = len(domain_cards)
-            sold_domains_list = []
-            available_domains_list = []
-            total_sold_value = 0
-            
-            for card in domain_cards:
-                domain_info = self._extract_domain_info(card)
-                domains.append(domain_info)
-                
-                if domain_info['status'] == 'sold':
-                    sold_count += 1
-                    sold_domains_list.append(domain_info)
-                    # Add to total sold value if price is available
-                    if domain_info['price_numeric'] > 0:
-                        total_sold_value += domain_info['price_numeric']
-                elif domain_info['status'] == 'available':
-                    available_domains_list.append(domain_info)
+            try:
+                validator = self._load_validator(partner_url)
+                html_content, new_validator = await _fetch(session, partner_url, sem, limiter, validator)
+                if new_validator is validator:
+                    print(f"   {partner_name}: not modified since last fetch")
+                else:
+                    self._store_validator(partner_url, new_validator)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"   HTTP fetch failed for {partner_name} ({e}), using browser")
+                html_content = ""
             
-            # Calculate percentage sold
-            percentage_sold = (sold_count / total_count * 100) if total_count > 0 else 0
+            # Markup without the class name cannot hold cards, so it is not parsed
+            result = await parse(html_content) if 'domain-card' in html_content else None
             
-            print(f"   Result: {sold_count}/{total_count} sold ({percentage_sold:.1f}%)")
+            # Cards rendered client-side are not in the served HTML, and the class
+            # name alone may appear in its CSS or scripts: render any page that
+            # yielded no cards
+            if result is None or not result['has_premium_domains']:
+                html_content = await self._get_page_with_selenium_async(partner_url)
+                if not html_content:
+                    return {
+                        'partner': partner_name,
+                        'url': partner_url,
+                        'error': "Failed to retrieve page content",
+                        'timestamp': scan_time,
+                        'has_premium_domains': False
+                    }
+                result = await parse(html_content)
             
-            return {
-                'partner': partner_name,
-                'url': partner_url,
-                'timestamp': datetime.now().isoformat(),
-                'has_premium_domains': has_premium_domains,
-                'total_domains': total_count,
-                'sold_domains': sold_count,
-                'available_domains': total_count - sold_count,
-                'percentage_sold': round(percentage_sold, 2),
-                'total_sold_value': total_sold_value,
-                'domains': domains,
-                'sold_domains_list': sold_domains_list,
-                'available_domains_list': available_domains_list,
-                'needs_update': self._needs_update(percentage_sold, sold_count, total_count, has_premium_domains)
-            }
+            self._cache_put(partner_url, html_content)
+            return result
             
         except Exception as e:
             return {
-                'partner': partner_url.split('/')[-1] or partner_url.split('/')[-2],
+                'partner': partner_name,
                 'url': partner_url,
                 'error': f"Parsing failed: {str(e)}",
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': scan_time,
                 'has_premium_domains': False
             }
     
-    def _get_page_with_selenium(self, url: str) -> str:
+    async def _get_page_with_selenium_async(self, url: str) -> str:
+        """Render a page on the browser pool without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._browser_executor, self._render_page, url)
+    
+    def _render_page(self, url: str) -> str:
+        """Render a page on a pooled driver (runs on a browser worker thread)
+        
+        Each driver is only ever used by one thread at a time, and its page
+        loads are spaced out by the configured delay.
+        """
+        with self._checkout() as driver:
+            html_content = self._get_page_with_selenium(url, driver)
+            time.sleep(self.delay)
+        return html_content
+    
+    def _get_page_with_selenium(self, url: str, driver) -> str:
         """Get page content using Selenium for JavaScript rendering"""
         try:
-            self.driver.get(url)
+            driver.get(url)
             
             # Wait for domain cards to load - much shorter timeout
             try:
                 # Wait up to 5 seconds for at least one domain card to appear
-                WebDriverWait(self.driver, 5).until(
+                WebDriverWait(driver, 5).until(
                     EC.presence_of_element_located((By.CLASS_NAME, "domain-card"))
                 )
+                # Cards may still be streaming in; wait until their count settles
+                try:
+                    WebDriverWait(driver, 2, poll_frequency=0.2).until(_card_count_stable())
+                except TimeoutException:
+                    pass
                 print("Domain cards loaded")
-                # Only wait extra time if we found cards
-                time.sleep(1)
             except TimeoutException:
                 print("No domain cards found")
-                # No additional wait if no cards found
             
-            return self.driver.page_source
+            cards_html = driver.execute_script(_CARDS_HTML_JS)
+            return cards_html or driver.page_source
             
         except WebDriverException as e:
             print(f"Selenium error: {e}")
             return None
     
-    def _extract_domain_info(self, card) -> Dict:
-        """Extract domain information from a domain card"""
-        try:
-            # Get domain name
-            domain_slug = card.find('div', class_='domain-slug')
-            domain_ending = card.find('strong', class_='domain-ending')
-            
-            domain_name = ""
-            if domain_slug and domain_ending:
-                domain_name = domain_slug.text.strip() + domain_ending.text.strip()
-            
-            # Check button status
-            button = card.find('button', class_='add-to-cart')
-            button_text = button.text.strip().lower() if button else ""
-            button_classes = button.get('class', []) if button else []
-            has_disabled = button.has_attr('disabled') if button else False
-            
-            # Determine status based on button text first
-            if button_text == "sold":
-                status = "sold"
-            elif button_text == "coming soon":
-                status = "coming_soon"
-            elif button_text == "buy now":
-                status = "available"
-            elif button_text.startswith("available"):  # Handles "Available [date/time]"
-                status = "coming_soon"
-            else:
-                # Fallback: check if button has sold class and is disabled
-                is_sold_class = button and ('sold' in button_classes and has_disabled)
-                status = "sold" if is_sold_class else "available"
-            
-            # Get price
-            price_element = card.find('div', class_='price')
-            price = ""
-            price_numeric = 0
-            if price_element:
-                price_text = price_element.text.strip()
-                # Extract price using regex
-                price_match = re.search(r'\$(\d+)', price_text)
-                if price_match:
-                    price = f"${price_match.group(1)}"
-                    price_numeric = int(price_match.group(1))
-            
-            return {
-                'domain': domain_name,
-                'status': status,
-                'price': price,
-                'price_numeric': price_numeric,
-                'button_text': button.text.strip() if button else ""
-            }
-            
-        except Exception as e:
-            return {
-                'domain': 'Unknown',
-                'status': 'error',
-                'price': '',
-                'price_numeric': 0,
-                'error': str(e)
-            }
-    
-    def _needs_update(self, percentage_sold: float, sold_count: int, total_count: int, has_premium_domains: bool) -> Dict:
-        """Determine if a page needs updating based on sales metrics"""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _needs_update(percentage_sold: float, sold_count: int, total_count: int, has_premium_domains: bool) -> Dict:
+        """Determine if a page needs updating based on sales metrics
+        
+        Results are cached, so callers must copy the returned dict before changing it.
+        """
         needs_update = False
         priority = "low"
         reason = ""
@@ -278,9 +569,9 @@ class DomainTracker:
             'reason': reason
         }
     
-    def scan_all_partners(self, partner_urls: List[str]) -> Dict:
+    async def scan_all_partners(self, partner_urls: List[str]) -> Dict:
         """
-        Scan all partner pages and return comprehensive report
+        Scan all partner pages concurrently and return comprehensive report
         
         Args:
             partner_urls: List of partner page URLs to scan
@@ -288,19 +579,34 @@ class DomainTracker:
         Returns:
             Dictionary containing scan results for all partners
         """
-        results = []
-        
         print(f"Starting scan of {len(partner_urls)} partner pages...")
+        self._prune_cache()
+        partner_jobs = [(_partner_name(url), url) for url in partner_urls]
+        # Pages are scanned within seconds of each other, so they share one timestamp
+        scan_time = datetime.now().isoformat()
         
-        for i, url in enumerate(partner_urls, 1):
-            print(f"Scanning {i}/{len(partner_urls)}: {url}")
-            
-            result = self.scrape_partner_page(url)
-            results.append(result)
-            
-            # Add delay between requests to be respectful
-            if i < len(partner_urls):
-                time.sleep(self.delay)
+        # Bounded concurrency and a token bucket replace the fixed delay between HTTP requests
+        sem = asyncio.Semaphore(self.max_concurrency)
+        limiter = AsyncLimiter(self.requests_per_second, 1)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=300)
+        # Pages that need JS rendering are spread over the warm browser pool
+        self._browser_executor = ThreadPoolExecutor(max_workers=self.browser_pool_size)
+        # Threads, not processes: forking while the browser threads run can deadlock,
+        # and a few dozen small pages do not repay the cost of worker processes
+        self._parse_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        
+        try:
+            async with aiohttp.ClientSession(connector=connector, headers={'User-Agent': USER_AGENT}) as session:
+                results = await asyncio.gather(*[
+                    self.scrape_partner_page_async(session, sem, limiter, name, url, scan_time)
+                    for name, url in partner_jobs
+                ])
+        finally:
+            self._browser_executor.shutdown(wait=True)
+            self._browser_executor = None
+            self._parse_executor.shutdown(wait=True)
+            self._parse_executor = None
+        results = list(results)
         
         # Generate summary
         summary = self._generate_summary(results)
@@ -312,29 +618,41 @@ class DomainTracker:
         }
     
     def _generate_summary(self, results: List[Dict]) -> Dict:
-        """Generate summary statistics from scan results"""
-        successful_scans = [r for r in results if 'error' not in r]
-        failed_scans = [r for r in results if 'error' in r]
+        """Generate summary statistics from scan results in a single pass"""
+        successful = failed = with_domains = without_domains = 0
+        needs_update = high_priority = 0
+        total_domains = total_sold = total_sold_value = 0
         
-        # Separate pages with and without premium domains
-        pages_with_domains = [r for r in successful_scans if r.get('has_premium_domains', False)]
-        pages_without_domains = [r for r in successful_scans if not r.get('has_premium_domains', False)]
-        
-        needs_update = [r for r in pages_with_domains if r.get('needs_update', {}).get('needs_update', False)]
-        high_priority = [r for r in needs_update if r.get('needs_update', {}).get('priority') == 'high']
-        
-        total_domains = sum(r.get('total_domains', 0) for r in pages_with_domains)
-        total_sold = sum(r.get('sold_domains', 0) for r in pages_with_domains)
-        total_sold_value = sum(r.get('total_sold_value', 0) for r in pages_with_domains)
+        for r in results:
+            if 'error' in r:
+                failed += 1
+                continue
+            successful += 1
+            
+            # Separate pages with and without premium domains
+            if not r.get('has_premium_domains', False):
+                without_domains += 1
+                continue
+            with_domains += 1
+            
+            update_info = r.get('needs_update', {})
+            if update_info.get('needs_update', False):
+                needs_update += 1
+                if update_info.get('priority') == 'high':
+                    high_priority += 1
+            
+            total_domains += r.get('total_domains', 0)
+            total_sold += r.get('sold_domains', 0)
+            total_sold_value += r.get('total_sold_value', 0)
         
         return {
             'total_partners_scanned': len(results),
-            'successful_scans': len(successful_scans),
-            'failed_scans': len(failed_scans),
-            'pages_with_premium_domains': len(pages_with_domains),
-            'pages_without_premium_domains': len(pages_without_domains),
-            'partners_needing_update': len(needs_update),
-            'high_priority_updates': len(high_priority),
+            'successful_scans': successful,
+            'failed_scans': failed,
+            'pages_with_premium_domains': with_domains,
+            'pages_without_premium_domains': without_domains,
+            'partners_needing_update': needs_update,
+            'high_priority_updates': high_priority,
             'total_domains_across_all_partners': total_domains,
             'total_sold_across_all_partners': total_sold,
             'total_sold_value': total_sold_value,
@@ -398,8 +716,8 @@ class DomainTracker:
             main_filename = filename
         
         # Save main results
-        with open(main_filename, 'w', encoding='utf-8') as f:
-            json.dump(scan_results, f, indent=2, ensure_ascii=False)
+        with open(main_filename, 'wb') as f:
+            f.write(dumps(scan_results, pretty=True))
         
         # Save pages without domains to separate file
         pages_without_domains = []
@@ -425,6 +743,12 @@ class DomainTracker:
 
 def main():
     """Main function to run the domain tracker"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Domain Sales Tracker')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore pages cached earlier today and fetch every page again')
+    args = parser.parse_args()
     
     # Load URLs from shared configuration
     # Set include_not_launched=True to scan not-yet-launched partners
@@ -436,20 +760,20 @@ def main():
     print(f"Will scan {len(partner_urls)} partner pages")
     print("=" * 50)
     
-    # Initialize tracker with Selenium
-    tracker = DomainTracker(
+    # Initialize tracker (Selenium only starts if a page needs JS rendering)
+    with DomainTracker(
         delay_between_requests=0.5,  # Reduced delay for faster scanning
-        headless=True
-    )
-    
-    # Scan all partners
-    results = tracker.scan_all_partners(partner_urls)
-    
-    # Print report
-    tracker.print_report(results)
-    
-    # Save results
-    tracker.save_results(results)
+        headless=True,
+        force_refresh=args.no_cache
+    ) as tracker:
+        # Scan all partners
+        results = asyncio.run(tracker.scan_all_partners(partner_urls))
+        
+        # Print report
+        tracker.print_report(results)
+        
+        # Save results
+        tracker.save_results(results)
     
     print("\nScan completed!")
 
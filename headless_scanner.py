@@ -4,10 +4,15 @@ Headless Domain Scanner for CI/CD Automation
 Runs without GUI for GitHub Actions and other automated environments
 """
 
+import gzip
 import json
-import time
+import shutil
 import sys
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, List
 import re
@@ -21,11 +26,53 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.service import Service
-from bs4 import BeautifulSoup
 
 # Import partner URLs configuration
 from partner_urls import get_all_urls
 
+from json_io import dumps
+
+# Drivers are replaced after this many pages to cap Chrome's memory growth
+BROWSER_POOL_RECYCLE_AFTER = 100
+
+# Requests that never contribute to the domain cards: static assets plus
+# third-party analytics, tag managers and ad trackers
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.woff*', '*.ttf',
+    '*.css', '*.mp4',
+    '*google-analytics*', '*googletagmanager.com*', '*doubleclick*',
+    '*segment.io*', '*segment.com*', '*hotjar*', '*fullstory*',
+    '*optimizely*', '*facebook.net*',
+]
+
+_PRICE_RE = re.compile(r'\$(\d+)')
+
+# Domain statuses. Every domain entry points at one of these shared strings
+STATUS_SOLD = 'sold'
+STATUS_AVAILABLE = 'available'
+STATUS_COMING_SOON = 'coming_soon'
+STATUS_ERROR = 'error'
+
+# Reads every domain card's fields from the live DOM in one round trip;
+# elements a card doesn't have come back as null
+_CARD_FIELDS_JS = """
+return Array.from(document.querySelectorAll('div.domain-card'), card => {
+    const text = selector => {
+        const el = card.querySelector(selector);
+        return el ? el.textContent : null;
+    };
+    const button = card.querySelector('button.add-to-cart');
+    return {
+        slug: text('div.domain-slug'),
+        ending: text('strong.domain-ending'),
+        button: button ? button.textContent : null,
+        button_class: button ? button.className : '',
+        disabled: button ? button.hasAttribute('disabled') : false,
+        price: text('div.price')
+    };
+});
+"""
+
 # Optional Google Sheets integration
 def get_urls_with_fallback(include_not_launched: bool = False, use_sheets: bool = False):
     """Get URLs from Google Sheets if configured, otherwise use local file"""
@@ -38,7 +85,7 @@ def get_urls_with_fallback(include_not_launched: bool = False, use_sheets: bool
     return get_all_urls(include_not_launched=include_not_launched)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     partner: str
     url: str
@@ -50,66 +97,195 @@ class ScanResult:
     total_sold_value: int
     error_message: str = ""
     domains_data: List = None
+    sold_list: List = None
+    available_list: List = None
+
+
+def _card_count_stable():
+    """WebDriverWait condition: the number of domain cards stopped changing between two polls"""
+    last_count = [None]
+    
+    def condition(driver):
+        count = len(driver.find_elements(By.CLASS_NAME, 'domain-card'))
+        stable = count > 0 and count == last_count[0]
+        last_count[0] = count
+        return stable
+    
+    return condition
+
+
+def _make_driver():
+    """Create a headless Chrome driver"""
+    chrome_options = Options()
+    chrome_options.add_argument('--headless=new')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    # Return from get() once the DOM is parsed; scan_partner waits for the cards itself
+    chrome_options.page_load_strategy = 'eager'
+
+    # For GitHub Actions, use system Chrome
+    if os.environ.get('GITHUB_ACTIONS'):
+        chrome_options.binary_location = '/usr/bin/google-chrome'
+        driver = webdriver.Chrome(options=chrome_options)
+    else:
+        from webdriver_manager.chrome import ChromeDriverManager
+        service = Service(ChromeDriverManager().install())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+
+    # Remove webdriver property to avoid detection
+    driver.execute_cdp_cmd('Network.setUserAgentOverride', {
+        "userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    })
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    
+    # Skip static assets, analytics and ad trackers
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    # No implicit wait: explicit WebDriverWaits own every timeout, and an
+    # implicit one would stretch each poll on pages without domain cards
+    driver.implicitly_wait(0)
+    return driver
+
+
+class DriverPool:
+    """A fixed set of Chrome drivers checked out one page at a time"""
+    
+    def __init__(self, size: int, recycle_after: int = BROWSER_POOL_RECYCLE_AFTER):
+        self.size = size
+        self.recycle_after = recycle_after
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._created = 0
+        self._recycled = 0
+        self._checkouts = 0
+        
+        # Start the browsers side by side rather than paying each startup in turn
+        errors = []
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            for future in [executor.submit(self._new_driver) for _ in range(size)]:
+                try:
+                    self._idle.put(future.result())
+                except Exception as e:
+                    errors.append(e)
+        
+        # Don't leak the browsers that did start when one of them failed
+        if errors:
+            self.close()
+            raise errors[0]
+    
+    def _new_driver(self):
+        driver = _make_driver()
+        with self._lock:
+            self._uses[driver] = 0
+            self._created += 1
+        return driver
+    
+    @contextmanager
+    def driver(self):
+        """Check a driver out for one page, recycling it once it's been used enough"""
+        driver = self._idle.get()
+        try:
+            yield driver
+        finally:
+            with self._lock:
+                self._checkouts += 1
+                self._uses[driver] += 1
+                worn_out = self._uses[driver] >= self.recycle_after
+            if worn_out:
+                driver = self._recycle(driver)
+            self._idle.put(driver)
+    
+    def _recycle(self, driver):
+        """Swap a worn-out driver for a fresh one; keep the old one if Chrome won't start"""
+        try:
+            fresh = self._new_driver()
+        except Exception:
+            with self._lock:
+                self._uses[driver] = 0
+            return driver
+        with self._lock:
+            del self._uses[driver]
+            self._recycled += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        return fresh
+    
+    def stats(self) -> Dict:
+        """Pool counters for the end-of-scan summary"""
+        with self._lock:
+            return {
+                'size': self.size,
+                'idle': self._idle.qsize(),
+                'created': self._created,
+                'recycled': self._recycled,
+                'checkouts': self._checkouts
+            }
+    
+    def close(self):
+        """Quit every driver in the pool"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception:
+                pass
 
 
 class HeadlessScanner:
-    def __init__(self, include_not_launched: bool = False, use_sheets: bool = False):
+    def __init__(self, include_not_launched: bool = False, use_sheets: bool = False,
+                 max_workers: int = 4):
         self.partner_urls = get_urls_with_fallback(
             include_not_launched=include_not_launched,
             use_sheets=use_sheets
         )
-        self.scan_results = {}
-        self.driver = None
-        
-    def setup_driver(self):
-        """Setup headless Chrome driver"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        
-        # For GitHub Actions, use system Chrome
-        if os.environ.get('GITHUB_ACTIONS'):
-            chrome_options.binary_location = '/usr/bin/google-chrome'
-            self.driver = webdriver.Chrome(options=chrome_options)
-        else:
-            from webdriver_manager.chrome import ChromeDriverManager
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # Remove webdriver property to avoid detection
-        self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        self.driver.implicitly_wait(10)
-        
+        self.totals = {}
+        self.max_workers = max_workers
+        # One driver per worker, started when a scan begins
+        self.driver_pool = None
+    
     def scan_partner(self, url: str, partner_name: str) -> ScanResult:
-        """Scan a single partner page"""
+        """Scan a single partner page with a driver from the pool"""
+        with self.driver_pool.driver() as driver:
+            return self._scan_with_driver(driver, url, partner_name)
+    
+    def _scan_with_driver(self, driver, url: str, partner_name: str) -> ScanResult:
+        """Load one partner page in the given driver and tally its domain cards"""
         try:
-            self.driver.get(url)
+            driver.get(url)
             
             # Wait for domain cards
             try:
-                WebDriverWait(self.driver, 5).until(
+                WebDriverWait(driver, 5).until(
                     EC.presence_of_element_located((By.CLASS_NAME, "domain-card"))
                 )
-                time.sleep(1)
                 has_cards = True
             except TimeoutException:
                 has_cards = False
             
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            domain_cards = soup.find_all('div', class_='domain-card')
+            # Cards may still be streaming in; wait until their count settles
+            if has_cards:
+                try:
+                    WebDriverWait(driver, 2, poll_frequency=0.2).until(_card_count_stable())
+                except TimeoutException:
+                    pass
+            
+            # Read the cards straight from the browser's DOM; the page source
+            # never crosses over to Python
+            domain_cards = driver.execute_script(_CARD_FIELDS_JS) if has_cards else []
             
-            if not has_cards or len(domain_cards) == 0:
+            if not domain_cards:
                 return ScanResult(
                     partner=partner_name,
                     url=url,
@@ -122,20 +298,26 @@ class HeadlessScanner:
                     domains_data=[]
                 )
             
-            # Extract domain information
+            # Extract domain information, splitting out sold and available
+            # domains in the same pass
             domains_data = []
-            sold_count = 0
+            sold_list = []
+            available_list = []
             total_sold_value = 0
             
             for card in domain_cards:
                 domain_info = self.extract_domain_info(card)
                 domains_data.append(domain_info)
                 
-                if domain_info['status'] == 'sold':
-                    sold_count += 1
+                status = domain_info['status']
+                if status is STATUS_SOLD:
+                    sold_list.append(domain_info)
                     if domain_info['price_numeric'] > 0:
                         total_sold_value += domain_info['price_numeric']
+                elif status is STATUS_AVAILABLE:
+                    available_list.append(domain_info)
             
+            sold_count = len(sold_list)
             percentage_sold = (sold_count / len(domain_cards) * 100) if domain_cards else 0
             
             return ScanResult(
@@ -147,7 +329,9 @@ class HeadlessScanner:
                 sold_domains=sold_count,
                 percentage_sold=round(percentage_sold, 2),
                 total_sold_value=total_sold_value,
-                domains_data=domains_data
+                domains_data=domains_data,
+                sold_list=sold_list,
+                available_list=available_list
             )
             
         except Exception as e:
@@ -163,39 +347,40 @@ class HeadlessScanner:
                 error_message=str(e)
             )
     
-    def extract_domain_info(self, card) -> Dict:
-        """Extract domain information from a card"""
+    def extract_domain_info(self, card: Dict) -> Dict:
+        """Extract domain information from a card's fields as read by _CARD_FIELDS_JS"""
         try:
-            domain_slug = card.find('div', class_='domain-slug')
-            domain_ending = card.find('strong', class_='domain-ending')
+            domain_slug = card['slug']
+            domain_ending = card['ending']
             
             domain_name = ""
-            if domain_slug and domain_ending:
-                domain_name = domain_slug.text.strip() + domain_ending.text.strip()
+            if domain_slug is not None and domain_ending is not None:
+                domain_name = domain_slug.strip() + domain_ending.strip()
             
-            button = card.find('button', class_='add-to-cart')
-            button_text = button.text.strip().lower() if button else ""
-            button_classes = button.get('class', []) if button else []
-            has_disabled = button.has_attr('disabled') if button else False
+            button = card['button']
+            has_button = button is not None
+            button_text = button.strip().lower() if has_button else ""
+            button_classes = card['button_class'].split()
+            has_disabled = card['disabled']
             
             if button_text == "sold":
-                status = "sold"
+                status = STATUS_SOLD
             elif button_text == "coming soon":
-                status = "coming_soon"
+                status = STATUS_COMING_SOON
             elif button_text == "buy now":
-                status = "available"
+                status = STATUS_AVAILABLE
             elif button_text.startswith("available"):
-                status = "coming_soon"
+                status = STATUS_COMING_SOON
             else:
-                is_sold_class = button and ('sold' in button_classes and has_disabled)
-                status = "sold" if is_sold_class else "available"
+                is_sold_class = has_button and ('sold' in button_classes and has_disabled)
+                status = STATUS_SOLD if is_sold_class else STATUS_AVAILABLE
             
-            price_element = card.find('div', class_='price')
+            price_element = card['price']
             price = ""
             price_numeric = 0
-            if price_element:
-                price_text = price_element.text.strip()
-                price_match = re.search(r'\$(\d+)', price_text)
+            if price_element is not None:
+                price_text = price_element.strip()
+                price_match = _PRICE_RE.search(price_text)
                 if price_match:
                     price = f"${price_match.group(1)}"
                     price_numeric = int(price_match.group(1))
@@ -205,160 +390,201 @@ class HeadlessScanner:
                 'status': status,
                 'price': price,
                 'price_numeric': price_numeric,
-                'button_text': button.text.strip() if button else ""
+                'button_text': button.strip() if has_button else ""
             }
         except Exception as e:
             return {
                 'domain': 'Unknown',
-                'status': 'error',
+                'status': STATUS_ERROR,
                 'price': '',
                 'price_numeric': 0,
                 'error': str(e)
             }
     
-    def run_scan(self) -> Dict:
-        """Run the full scan and return results"""
+    def run_scan(self, output_path: str = 'scan_results.json') -> Dict:
+        """Run the full scan, streaming each partner's result to output_path
+        
+        Results are written in partner list order as soon as they (and every
+        partner before them) are done, so only summary counters stay in memory.
+        Returns the scan timestamp and summary.
+        """
         print(f"🚀 Starting scan of {len(self.partner_urls)} partners...")
         print("=" * 60)
         
+        self._reset_totals()
+        scan_timestamp = datetime.now().isoformat()
+        total = len(self.partner_urls)
         try:
-            self.setup_driver()
-            
-            for i, url in enumerate(self.partner_urls):
-                partner_name = url.rstrip('/').split('/')[-1]
-                if not partner_name:
-                    partner_name = url.rstrip('/').split('/')[-2]
+            self.driver_pool = DriverPool(self.max_workers)
+            with open(output_path, 'wb') as f, \
+                    ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                f.write(b'{\n  "scan_timestamp": ' + json.dumps(scan_timestamp).encode() + b',\n  "results": [')
                 
-                print(f"[{i+1}/{len(self.partner_urls)}] Scanning {partner_name}...", end=" ")
+                futures = {}
+                for index, url in enumerate(self.partner_urls):
+                    partner_name = url.rstrip('/').split('/')[-1]
+                    if not partner_name:
+                        partner_name = url.rstrip('/').split('/')[-2]
+                    futures[executor.submit(self.scan_partner, url, partner_name)] = index
                 
-                result = self.scan_partner(url, partner_name)
-                self.scan_results[partner_name] = result
+                # Finished results wait here until every earlier partner is written
+                finished = {}
+                next_index = 0
+                for i, future in enumerate(as_completed(futures)):
+                    result = future.result()
+                    print(f"[{i+1}/{total}] {result.partner}:", end=" ")
+                    
+                    if result.status == 'error':
+                        print(f"❌ Error: {result.error_message[:50]}")
+                    elif not result.has_domains:
+                        print("⚪ No domains")
+                    elif result.percentage_sold >= 90:
+                        print(f"🚨 {result.sold_domains}/{result.total_domains} sold ({result.percentage_sold:.1f}%)")
+                    elif result.percentage_sold >= 50:
+                        print(f"⚠️  {result.sold_domains}/{result.total_domains} sold ({result.percentage_sold:.1f}%)")
+                    else:
+                        print(f"✅ {result.sold_domains}/{result.total_domains} sold ({result.percentage_sold:.1f}%)")
+                    
+                    finished[futures[future]] = result
+                    while next_index in finished:
+                        result = finished.pop(next_index)
+                        self._tally(result)
+                        entry = dumps(self._result_entry(result, scan_timestamp), pretty=True)
+                        f.write((b',\n    ' if next_index else b'\n    ') + entry.replace(b'\n', b'\n    '))
+                        next_index += 1
                 
-                if result.status == 'error':
-                    print(f"❌ Error: {result.error_message[:50]}")
-                elif not result.has_domains:
-                    print("⚪ No domains")
-                elif result.percentage_sold >= 90:
-                    print(f"🚨 {result.sold_domains}/{result.total_domains} sold ({result.percentage_sold:.1f}%)")
-                elif result.percentage_sold >= 50:
-                    print(f"⚠️  {result.sold_domains}/{result.total_domains} sold ({result.percentage_sold:.1f}%)")
-                else:
-                    print(f"✅ {result.sold_domains}/{result.total_domains} sold ({result.percentage_sold:.1f}%)")
-                
-                time.sleep(0.5)
+                summary = self._summary()
+                f.write(b'\n  ],\n  "summary": ' + dumps(summary, pretty=True).replace(b'\n', b'\n  ') + b'\n}\n')
             
+            stats = self.driver_pool.stats()
+            print(f"\n🌐 Browser pool: {stats['created']} started, {stats['recycled']} recycled, "
+                  f"{stats['checkouts']} pages")
         finally:
-            if self.driver:
-                self.driver.quit()
+            if self.driver_pool:
+                self.driver_pool.close()
         
-        return self.generate_report()
+        self._print_summary(summary)
+        return {'scan_timestamp': scan_timestamp, 'summary': summary}
     
-    def generate_report(self) -> Dict:
-        """Generate a comprehensive report"""
-        completed_results = [r for r in self.scan_results.values() if r.status == 'completed']
-        with_domains = [r for r in completed_results if r.has_domains]
-        without_domains = [r for r in completed_results if not r.has_domains]
-        
-        total_domains = sum(r.total_domains for r in with_domains)
-        total_sold = sum(r.sold_domains for r in with_domains)
-        total_value = sum(r.total_sold_value for r in with_domains)
-        
-        needs_update = len([r for r in with_domains if r.percentage_sold >= 50])
-        high_priority = len([r for r in with_domains if r.percentage_sold >= 90])
-        
-        sell_through = (total_sold / total_domains * 100) if total_domains > 0 else 0
-        
-        # Convert results to dict format
-        results = []
-        sorted_results = sorted(self.scan_results.values(), key=lambda r: r.partner.lower())
+    def _reset_totals(self):
+        """Zero the running counters behind the scan summary"""
+        self.totals = {
+            'partners': 0,
+            'completed': 0,
+            'failed': 0,
+            'with_domains': 0,
+            'without_domains': 0,
+            'needs_update': 0,
+            'high_priority': 0,
+            'domains': 0,
+            'sold': 0,
+            'sold_value': 0
+        }
+    
+    def _tally(self, result: ScanResult):
+        """Add one partner's result to the running counters"""
+        totals = self.totals
+        totals['partners'] += 1
+        if result.status == 'error':
+            totals['failed'] += 1
+            return
+        totals['completed'] += 1
+        if not result.has_domains:
+            totals['without_domains'] += 1
+            return
+        totals['with_domains'] += 1
+        totals['domains'] += result.total_domains
+        totals['sold'] += result.sold_domains
+        totals['sold_value'] += result.total_sold_value
+        if result.percentage_sold >= 50:
+            totals['needs_update'] += 1
+        if result.percentage_sold >= 90:
+            totals['high_priority'] += 1
+    
+    def _result_entry(self, result: ScanResult, timestamp: str) -> Dict:
+        """One partner's entry in the results file, stamped with the scan's timestamp"""
+        if result.status == 'error':
+            return {
+                'partner': result.partner,
+                'url': result.url,
+                'error': result.error_message,
+                'timestamp': timestamp,
+                'has_premium_domains': False
+            }
         
-        for result in sorted_results:
-            if result.status == 'error':
-                results.append({
-                    'partner': result.partner,
-                    'url': result.url,
-                    'error': result.error_message,
-                    'timestamp': datetime.now().isoformat(),
-                    'has_premium_domains': False
-                })
-            else:
-                sold_domains_list = [d for d in (result.domains_data or []) if d['status'] == 'sold']
-                available_domains_list = [d for d in (result.domains_data or []) if d['status'] == 'available']
-                
-                if not result.has_domains:
-                    needs_update_info = {
-                        'needs_update': False,
-                        'priority': "none",
-                        'reason': "No premium domains on this page"
-                    }
-                elif result.percentage_sold >= 90:
-                    needs_update_info = {
-                        'needs_update': True,
-                        'priority': "high",
-                        'reason': f"Almost sold out ({result.sold_domains}/{result.total_domains} sold)"
-                    }
-                elif result.percentage_sold >= 50:
-                    needs_update_info = {
-                        'needs_update': True,
-                        'priority': "medium",
-                        'reason': f"Mostly sold ({result.sold_domains}/{result.total_domains} sold)"
-                    }
-                else:
-                    needs_update_info = {
-                        'needs_update': False,
-                        'priority': "low",
-                        'reason': ""
-                    }
-                
-                results.append({
-                    'partner': result.partner,
-                    'url': result.url,
-                    'timestamp': datetime.now().isoformat(),
-                    'has_premium_domains': result.has_domains,
-                    'total_domains': result.total_domains,
-                    'sold_domains': result.sold_domains,
-                    'available_domains': result.total_domains - result.sold_domains,
-                    'percentage_sold': result.percentage_sold,
-                    'total_sold_value': result.total_sold_value,
-                    'domains': result.domains_data,
-                    'sold_domains_list': sold_domains_list,
-                    'available_domains_list': available_domains_list,
-                    'needs_update': needs_update_info
-                })
+        if not result.has_domains:
+            needs_update_info = {
+                'needs_update': False,
+                'priority': "none",
+                'reason': "No premium domains on this page"
+            }
+        elif result.percentage_sold >= 90:
+            needs_update_info = {
+                'needs_update': True,
+                'priority': "high",
+                'reason': f"Almost sold out ({result.sold_domains}/{result.total_domains} sold)"
+            }
+        elif result.percentage_sold >= 50:
+            needs_update_info = {
+                'needs_update': True,
+                'priority': "medium",
+                'reason': f"Mostly sold ({result.sold_domains}/{result.total_domains} sold)"
+            }
+        else:
+            needs_update_info = {
+                'needs_update': False,
+                'priority': "low",
+                'reason': ""
+            }
         
-        report = {
-            'scan_timestamp': datetime.now().isoformat(),
-            'summary': {
-                'total_partners_scanned': len(self.scan_results),
-                'successful_scans': len(completed_results),
-                'failed_scans': len([r for r in self.scan_results.values() if r.status == 'error']),
-                'pages_with_premium_domains': len(with_domains),
-                'pages_without_premium_domains': len(without_domains),
-                'partners_needing_update': needs_update,
-                'high_priority_updates': high_priority,
-                'total_domains_across_all_partners': total_domains,
-                'total_sold_across_all_partners': total_sold,
-                'total_sold_value': total_value,
-                'overall_sell_through_rate': round(sell_through, 2)
-            },
-            'results': results
+        return {
+            'partner': result.partner,
+            'url': result.url,
+            'timestamp': timestamp,
+            'has_premium_domains': result.has_domains,
+            'total_domains': result.total_domains,
+            'sold_domains': result.sold_domains,
+            'available_domains': result.total_domains - result.sold_domains,
+            'percentage_sold': result.percentage_sold,
+            'total_sold_value': result.total_sold_value,
+            'domains': result.domains_data,
+            'sold_domains_list': result.sold_list or [],
+            'available_domains_list': result.available_list or [],
+            'needs_update': needs_update_info
         }
-        
-        # Print summary
+    
+    def _summary(self) -> Dict:
+        """The summary block of the results file, from the running counters"""
+        totals = self.totals
+        sell_through = (totals['sold'] / totals['domains'] * 100) if totals['domains'] > 0 else 0
+        return {
+            'total_partners_scanned': totals['partners'],
+            'successful_scans': totals['completed'],
+            'failed_scans': totals['failed'],
+            'pages_with_premium_domains': totals['with_domains'],
+            'pages_without_premium_domains': totals['without_domains'],
+            'partners_needing_update': totals['needs_update'],
+            'high_priority_updates': totals['high_priority'],
+            'total_domains_across_all_partners': totals['domains'],
+            'total_sold_across_all_partners': totals['sold'],
+            'total_sold_value': totals['sold_value'],
+            'overall_sell_through_rate': round(sell_through, 2)
+        }
+    
+    def _print_summary(self, summary: Dict):
+        """Print the end-of-scan summary"""
         print("\n" + "=" * 60)
         print("📊 SCAN SUMMARY")
         print("=" * 60)
-        print(f"Total Partners Scanned: {len(self.scan_results)}")
-        print(f"Partners with Domains:  {len(with_domains)}")
-        print(f"Partners without:       {len(without_domains)}")
-        print(f"Total Domains:          {total_domains}")
-        print(f"Total Sold:             {total_sold}")
-        print(f"Sell-through Rate:      {sell_through:.1f}%")
-        print(f"Total Value:            ${total_value:,}")
-        print(f"\n🚨 High Priority Updates: {high_priority}")
-        print(f"⚠️  Medium Priority:       {needs_update - high_priority}")
-        
-        return report
+        print(f"Total Partners Scanned: {summary['total_partners_scanned']}")
+        print(f"Partners with Domains:  {summary['pages_with_premium_domains']}")
+        print(f"Partners without:       {summary['pages_without_premium_domains']}")
+        print(f"Total Domains:          {summary['total_domains_across_all_partners']}")
+        print(f"Total Sold:             {summary['total_sold_across_all_partners']}")
+        print(f"Sell-through Rate:      {summary['overall_sell_through_rate']:.1f}%")
+        print(f"Total Value:            ${summary['total_sold_value']:,}")
+        print(f"\n🚨 High Priority Updates: {summary['high_priority_updates']}")
+        print(f"⚠️  Medium Priority:       {summary['partners_needing_update'] - summary['high_priority_updates']}")
 
 
 def main():
@@ -371,20 +597,27 @@ def main():
                         help='Fetch URLs from Google Sheets instead of local file')
     parser.add_argument('--output', '-o', default='scan_results.json',
                         help='Output JSON file path')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Number of partner pages to scan in parallel (one Chrome each)')
     args = parser.parse_args()
     
     scanner = HeadlessScanner(
         include_not_launched=args.include_not_launched,
-        use_sheets=args.use_sheets
+        use_sheets=args.use_sheets,
+        max_workers=args.workers
     )
-    report = scanner.run_scan()
-    
-    # Save results
-    with open(args.output, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    # Results are written to the output file as the scan goes
+    report = scanner.run_scan(args.output)
     
     print(f"\n✅ Results saved to {args.output}")
     
+    # CI uploads a compressed copy of the results as its artifact
+    if os.environ.get('GITHUB_ACTIONS'):
+        gz_path = args.output + '.gz'
+        with open(args.output, 'rb') as src, gzip.open(gz_path, 'wb', compresslevel=3) as dst:
+            shutil.copyfileobj(src, dst)
+        print(f"🗜️  Compressed copy saved to {gz_path}")
+    
     # Exit with error if there were high priority items
     if report['summary']['high_priority_updates'] > 0:
         sys.exit(0)  # Could use exit(1) to fail the build, but keeping as success
@@ -5,10 +5,13 @@ Simple GUI browser for domain scan results
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import json
+import gzip
 from datetime import datetime
 import webbrowser
 
+from json_io import loads
+
+
 class DomainResultsBrowser:
     def __init__(self, root):
         self.root = root
@@ -17,6 +20,8 @@ class DomainResultsBrowser:
         
         self.data = None
         self.filtered_results = []
+        self._filter_fields = []
+        self._filter_job = None
         
         self.setup_ui()
     
@@ -99,13 +104,15 @@ class DomainResultsBrowser:
         """Load JSON results file"""
         filename = filedialog.askopenfilename(
             title="Select domain scan results JSON file",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[("JSON files", "*.json *.json.gz"), ("All files", "*.*")]
         )
         
         if filename:
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
+                # CI artifacts are gzipped
+                opener = gzip.open if filename.endswith('.gz') else open
+                with opener(filename, 'rb') as f:
+                    self.data = loads(f.read())
                 
                 self.populate_summary()
                 self.populate_results()
@@ -129,47 +136,79 @@ Scan Date: {self.data['scan_timestamp']}"""
         self.summary_text.insert(1.0, summary_text)
     
     def populate_results(self):
-        """Populate the results tree"""
+        """Populate the results tree from a freshly loaded file"""
         if not self.data:
             return
         
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # The fields the filters test, pulled out of each result once per file
+        self._filter_fields = []
+        for result in self.data['results']:
+            needs_update = result.get('needs_update', {})
+            self._filter_fields.append((
+                'error' in result,
+                result['partner'].lower(),
+                result.get('has_premium_domains', False),
+                needs_update.get('needs_update', False),
+                needs_update.get('priority'),
+                result.get('percentage_sold', 0),
+                result.get('sold_domains', 0)
+            ))
+        
+        # Row ids are indexes into the results list, so a new file starts from scratch
+        self.tree.delete(*self.tree.get_children())
+        self.refresh_results()
+    
+    def refresh_results(self):
+        """Bring the tree in line with the current filters, touching only rows that change"""
+        self._filter_job = None
+        if not self.data:
+            return
         
-        self.filtered_results = []
+        filter_value = self.filter_var.get()
+        search_text = self.search_var.get().lower()
         
-        for result in self.data['results']:
-            if self.should_include_result(result):
+        self.filtered_results = []
+        wanted = []
+        for index, (result, fields) in enumerate(zip(self.data['results'], self._filter_fields)):
+            if self.should_include_result(fields, filter_value, search_text):
                 self.filtered_results.append(result)
-                self.add_result_to_tree(result)
+                wanted.append((str(index), result))
+        
+        wanted_ids = {iid for iid, _ in wanted}
+        stale = [iid for iid in self.tree.get_children() if iid not in wanted_ids]
+        if stale:
+            self.tree.delete(*stale)
+        
+        # Rows that stay keep their relative order, so new rows slot in by position
+        for position, (iid, result) in enumerate(wanted):
+            if not self.tree.exists(iid):
+                self.add_result_to_tree(result, iid, position)
     
-    def should_include_result(self, result):
-        """Check if result should be included based on filters"""
-        if 'error' in result:
+    def should_include_result(self, fields, filter_value, search_text):
+        """Check if a result's precomputed filter fields pass the current filters"""
+        is_error, partner_lower, has_domains, needs_update, priority, percentage, sold = fields
+        if is_error:
             return False
         
         # Apply filter
-        filter_value = self.filter_var.get()
-        if filter_value == "with_domains" and not result.get('has_premium_domains', False):
+        if filter_value == "with_domains" and not has_domains:
             return False
-        elif filter_value == "needs_update" and not result.get('needs_update', {}).get('needs_update', False):
+        elif filter_value == "needs_update" and not needs_update:
             return False
-        elif filter_value == "high_priority" and result.get('needs_update', {}).get('priority') != 'high':
+        elif filter_value == "high_priority" and priority != 'high':
             return False
-        elif filter_value == "sold_out" and result.get('percentage_sold', 0) != 100:
+        elif filter_value == "sold_out" and percentage != 100:
             return False
-        elif filter_value == "no_sales" and result.get('sold_domains', 0) > 0:
+        elif filter_value == "no_sales" and sold > 0:
             return False
         
         # Apply search
-        search_text = self.search_var.get().lower()
-        if search_text and search_text not in result['partner'].lower():
+        if search_text and search_text not in partner_lower:
             return False
         
         return True
     
-    def add_result_to_tree(self, result):
+    def add_result_to_tree(self, result, iid=None, position=tk.END):
         """Add a result to the tree view"""
         if not result.get('has_premium_domains', False):
             values = (result['partner'], "No domains", "-", "-", "No domains")
@@ -186,7 +225,7 @@ Scan Date: {self.data['scan_timestamp']}"""
             
             values = (result['partner'], sold_total, percentage, value, status)
         
-        item = self.tree.insert("", tk.END, values=values)
+        item = self.tree.insert("", position, iid=iid, values=values)
         
         # Color coding
         if result.get('needs_update', {}).get('priority') == 'high':
@@ -195,8 +234,10 @@ Scan Date: {self.data['scan_timestamp']}"""
             self.tree.set(item, "Status", "⚠️ " + values[4])
     
     def apply_filter(self, event=None):
-        """Apply current filters"""
-        self.populate_results()
+        """Apply current filters once typing pauses for 200ms"""
+        if self._filter_job is not None:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(200, self.refresh_results)
     
     def on_partner_select(self, event):
         """Handle partner selection"""
@@ -204,15 +245,8 @@ Scan Date: {self.data['scan_timestamp']}"""
         if not selection:
             return
         
-        item = selection[0]
-        partner_name = self.tree.item(item, "values")[0]
-        
-        # Find the result data
-        result = None
-        for r in self.filtered_results:
-            if r['partner'] == partner_name:
-                result = r
-                break
+        # Row ids are indexes into the loaded results
+        result = self.data['results'][int(selection[0])]
         
         if result:
             self.show_partner_details(result)
@@ -241,15 +275,20 @@ Scan Date: {self.data['scan_timestamp']}"""
                 details += f"🔴 UPDATE NEEDED ({update_info['priority'].upper()})\n"
                 details += f"Reason: {update_info['reason']}\n\n"
             
-            if result['sold_domains_list']:
+            # Older result files also carry these as separate lists
+            domains = result.get('domains') or []
+            sold_domains_list = [d for d in domains if d['status'] == 'sold']
+            available_domains_list = [d for d in domains if d['status'] == 'available']
+            
+            if sold_domains_list:
                 details += "💰 SOLD DOMAINS:\n"
-                for domain in result['sold_domains_list']:
+                for domain in sold_domains_list:
                     details += f"  • {domain['domain']} - {domain['price']}\n"
                 details += "\n"
             
-            if result['available_domains_list']:
+            if available_domains_list:
                 details += "🛒 AVAILABLE DOMAINS:\n"
-                for domain in result['available_domains_list']:
+                for domain in available_domains_list:
                     details += f"  • {domain['domain']} - {domain['price']}\n"
         
         self.details_text.insert(1.0, details)
@@ -0,0 +1,29 @@
+"""
+JSON reading and writing for the result files
+Shared between the scanners, generate_report.py and json_browser.py
+"""
+
+import json
+
+# orjson is optional; it reads and writes large result files much faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj, pretty: bool = False) -> bytes:
+    """Serialise obj as UTF-8 JSON, compact unless pretty is set"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads(data):
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -6,30 +6,73 @@ Combines domain scanning with live GUI updates as the scan progresses
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import json
-import time
+import hashlib
+import os
+import shutil
+import tempfile
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List
 import re
 import webbrowser
 from dataclasses import dataclass
-from queue import Queue
+from queue import Queue, Empty
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Selenium imports
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, WebDriverException
+from urllib3.exceptions import MaxRetryError, ProtocolError
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 # Import partner URLs configuration
 from partner_urls import get_all_urls
 
+from json_io import dumps, loads
+
+# Only domain card subtrees are built when a page is parsed. The strainer sees
+# the whole class attribute, so match the token: cards also carry e.g. "sold"
+_CARD_STRAINER = SoupStrainer('div', class_=lambda classes: classes is not None and 'domain-card' in classes.split())
+
+_PRICE_RE = re.compile(r'\$(\d+)')
+
+# (tag, class) of each element extract_domain_info reads from a card
+_CARD_FIELDS = {
+    ('div', 'domain-slug'): 'slug',
+    ('strong', 'domain-ending'): 'ending',
+    ('button', 'add-to-cart'): 'button',
+    ('div', 'price'): 'price',
+}
+
+# Browser failures worth retrying on another driver; a dead chromedriver raises
+# urllib3's connection errors rather than a WebDriverException
+_BROWSER_ERRORS = (WebDriverException, MaxRetryError, ProtocolError)
+
+# Browser loads are tried this many times, backing off 0.5s, 1s, ... between tries
+RENDER_ATTEMPTS = 3
+
+# Queue messages handled per Tk tick, so a burst cannot starve the UI
+MAX_MESSAGES_PER_TICK = 200
+
+# Parsed scan results are reused for this long unless a refresh is forced
+RESULT_CACHE_DIR = Path("~/.cache/landingpage-scraper").expanduser()
+RESULT_CACHE_TTL = 30 * 60
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
 @dataclass
 class ScanResult:
     partner: str
@@ -43,6 +86,88 @@ class ScanResult:
     error_message: str = ""
     domains_data: List = None
 
+def _card_fields(card) -> Dict:
+    """Find the first element for each _CARD_FIELDS entry in one walk over the card"""
+    fields = {}
+    for el in card.descendants:
+        name = el.name
+        if name is None:  # text node
+            continue
+        for cls in el.get('class') or ():
+            field = _CARD_FIELDS.get((name, cls))
+            if field and field not in fields:
+                fields[field] = el
+        if len(fields) == len(_CARD_FIELDS):
+            break
+    return fields
+
+
+def _price_digits(price_text: str) -> str:
+    """Digits of the first "$<digits>" amount in price_text, or "" if there is none"""
+    rest = price_text.partition('$')[2]
+    i = 0
+    while i < len(rest) and rest[i].isdecimal():
+        i += 1
+    if i:
+        return rest[:i]
+    # The first '$' has no amount after it; look further along
+    match = _PRICE_RE.search(price_text)
+    return match.group(1) if match else ""
+
+
+def _partner_name(url: str) -> str:
+    """Partner name shown for a URL: its last path segment"""
+    segments = url.rstrip('/').split('/')
+    return segments[-1] or segments[-2]
+
+
+def _shm_is_small() -> bool:
+    """True when /dev/shm is missing or too small for Chrome (e.g. Docker's 64MB default)"""
+    try:
+        return shutil.disk_usage('/dev/shm').total < 512 * 1024 * 1024
+    except OSError:
+        return True
+
+
+# Markup of the div.domain-card elements (any other classes allowed) that are
+# not nested in another card; scan_partner parses it like a served page
+_CARDS_HTML_JS = """
+return Array.from(document.querySelectorAll('div.domain-card'))
+    .filter(card => !card.parentElement.closest('div.domain-card'))
+    .map(card => card.outerHTML)
+    .join('');
+"""
+
+
+def _driver_alive(driver) -> bool:
+    """True if the browser behind driver still answers commands"""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        # A dead chromedriver surfaces as a urllib3 error, not a WebDriverException
+        return False
+
+
+def _cards_rendered(driver) -> bool:
+    """WebDriverWait condition: the document has finished loading and shows domain cards"""
+    return (driver.execute_script("return document.readyState") == "complete"
+            and bool(driver.find_elements(By.CLASS_NAME, "domain-card")))
+
+
+def _card_count_stable():
+    """WebDriverWait condition: the number of domain cards stopped changing between two polls"""
+    last_count = [None]
+    
+    def condition(driver):
+        count = len(driver.find_elements(By.CLASS_NAME, "domain-card"))
+        stable = count > 0 and count == last_count[0]
+        last_count[0] = count
+        return stable
+    
+    return condition
+
+
 class LiveDomainScanner:
     def __init__(self, root):
         self.root = root
@@ -50,12 +175,27 @@ class LiveDomainScanner:
         self.root.geometry("1400x900")
         
         self.partner_urls = []
+        self.partners = []  # (url, partner_name) pairs, in scan order
         self.scan_results = {}
+        self.reset_summary_totals()
         self.scanning = False
-        self.driver = None
+        self.use_cache = True
         self.scan_thread = None
         self.result_queue = Queue()
         
+        # Partners are scanned this many at a time; each worker borrows an idle
+        # Chrome from the pool, or starts one, only when a page needs rendering
+        self.max_workers = 6
+        self.idle_drivers = Queue()
+        self.cache_dirs = []
+        
+        # Pages whose cards are in the served HTML are fetched without a browser
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
+        # Connection errors and gateway errors are retried with backoff (0.5s, 1s)
+        retries = Retry(total=2, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        self.session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries))
+        
         # For saving results
         self.full_scan_data = None
         
@@ -63,6 +203,14 @@ class LiveDomainScanner:
         self.setup_default_urls()
         
         # Start the result processor
+        self.summary_stale = False
+        self.message_handlers = {
+            'status': self.on_status_message,
+            'result': self.on_result_message,
+            'progress': self.on_progress_message,
+            'complete': self.on_complete_message,
+            'error': self.on_error_message,
+        }
         self.process_results()
     
     def setup_ui(self):
@@ -85,12 +233,20 @@ class LiveDomainScanner:
         self.progress_label = ttk.Label(control_frame, text="Ready to scan")
         self.progress_label.pack(side=tk.LEFT, padx=(5, 10))
         
+        # Skip cached results and scan every page again
+        self.force_refresh = tk.BooleanVar(value=False)
+        ttk.Checkbutton(control_frame, text="Force refresh", variable=self.force_refresh).pack(side=tk.LEFT, padx=(0, 10))
+        
         # Export buttons
         ttk.Separator(control_frame, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=(10, 10))
         
         self.export_btn = ttk.Button(control_frame, text="Export Results", command=self.export_results, state=tk.DISABLED)
         self.export_btn.pack(side=tk.LEFT, padx=(0, 5))
         
+        # Exports are compact unless pretty-printing is asked for
+        self.pretty_export = tk.BooleanVar(value=False)
+        ttk.Checkbutton(control_frame, text="Pretty JSON", variable=self.pretty_export).pack(side=tk.LEFT, padx=(0, 5))
+        
         self.export_no_domains_btn = ttk.Button(control_frame, text="Export No-Domain URLs", command=self.export_no_domains, state=tk.DISABLED)
         self.export_no_domains_btn.pack(side=tk.LEFT, padx=(0, 10))
         
@@ -149,14 +305,13 @@ class LiveDomainScanner:
         # Set include_not_launched=True to scan not-yet-launched partners
         # Set include_not_launched=False to scan only launched partners
         self.partner_urls = get_all_urls(include_not_launched=False)
+        self.partners = [(url, _partner_name(url)) for url in self.partner_urls]
 
-        # Initialize tree with URLs
-        for url in self.partner_urls:
-            partner_name = url.rstrip('/').split('/')[-1]
-            if not partner_name:
-                partner_name = url.rstrip('/').split('/')[-2]
-            
-            self.tree.insert("", tk.END, values=(partner_name, "Waiting", "-", "-", "-", "-"))
+        # Initialize tree with URLs, remembering each partner's row
+        self.tree_items = {}
+        for url, partner_name in self.partners:
+            item = self.tree.insert("", tk.END, values=(partner_name, "Waiting", "-", "-", "-", "-"))
+            self.tree_items.setdefault(partner_name, item)
     
     def start_scan(self):
         """Start the scanning process"""
@@ -174,6 +329,9 @@ class LiveDomainScanner:
         
         # Clear previous results
         self.scan_results.clear()
+        self.reset_summary_totals()
+        # Read on the Tk thread; the scan threads only see the plain flag
+        self.use_cache = not self.force_refresh.get()
         
         # Start scanning in a separate thread
         self.scan_thread = threading.Thread(target=self.scan_worker)
@@ -183,102 +341,227 @@ class LiveDomainScanner:
     def stop_scan(self):
         """Stop the scanning process"""
         self.scanning = False
-        self.scan_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
-        self.status_bar.config(text="Scan stopped")
+        self.status_bar.config(text="Stopping scan...")
+        # Pages already loading finish; the worker then shuts the browsers down and
+        # reports complete, which re-enables scanning and export
+    
+    def start_driver(self):
+        """Start a headless Chrome for pages that render their cards client-side"""
+        chrome_options = Options()
+        chrome_options.add_argument('--headless=new')  # Use new headless mode
+        chrome_options.add_argument('--no-sandbox')
+        if _shm_is_small():
+            chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--window-size=1920,1080')
+        # Add user agent to avoid detection
+        chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+        # Disable automation flags
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        # Only the card markup matters, so skip images, stylesheets and fonts
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        # Give each driver its own disk cache so script bundles shared across
+        # partner pages are fetched once per driver, not once per page
+        cache_dir = tempfile.mkdtemp(prefix='live-scan-cache-')
+        self.cache_dirs.append(cache_dir)
+        chrome_options.add_argument(f'--disk-cache-dir={cache_dir}')
+        chrome_options.add_argument('--disk-cache-size=52428800')
         
-        if self.driver:
+        service = Service(ChromeDriverManager().install())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        
+        # Remove webdriver property to avoid detection
+        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": USER_AGENT})
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        
+        # Enable console log capture
+        driver.execute_cdp_cmd('Log.enable', {})
+        
+        # Waits are explicit; an implicit wait would stall every empty find_elements
+        driver.implicitly_wait(0)
+        return driver
+    
+    @contextmanager
+    def checkout_driver(self):
+        """Borrow an idle Chrome, starting a new one if every existing one is busy
+        
+        A driver is either idle or held by one worker, so there are never more
+        drivers than workers. However the worker's block exits, the driver goes
+        back to the pool or is quit.
+        """
+        try:
+            driver = self.idle_drivers.get_nowait()
+        except Empty:
+            driver = self.start_driver()
+        try:
+            yield driver
+        except BaseException:
+            # A page error leaves the browser usable; a crashed one is replaced
+            if _driver_alive(driver):
+                self.idle_drivers.put(driver)
+            else:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+            raise
+        else:
+            self.idle_drivers.put(driver)
+    
+    def quit_drivers(self):
+        """Quit every idle Chrome and remove the drivers' cache directories"""
+        while True:
+            try:
+                driver = self.idle_drivers.get_nowait()
+            except Empty:
+                break
             try:
-                self.driver.quit()
-            except:
+                driver.quit()
+            except Exception:
                 pass
-            self.driver = None
+        while self.cache_dirs:
+            shutil.rmtree(self.cache_dirs.pop(), ignore_errors=True)
     
     def scan_worker(self):
-        """Worker thread for scanning"""
+        """Worker thread for scanning: runs partner scans on a thread pool"""
+        self.completed_count = 0
+        self.count_lock = threading.Lock()
         try:
-            # Setup Selenium
-            chrome_options = Options()
-            chrome_options.add_argument('--headless=new')  # Use new headless mode
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            # Add user agent to avoid detection
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            # Disable automation flags
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # Remove webdriver property to avoid detection
-            self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            # Enable console log capture
-            self.driver.execute_cdp_cmd('Log.enable', {})
-            
-            self.driver.implicitly_wait(10)
-            
-            # Scan each URL
-            for i, url in enumerate(self.partner_urls):
-                if not self.scanning:
-                    break
-                
-                partner_name = url.rstrip('/').split('/')[-1]
-                if not partner_name:
-                    partner_name = url.rstrip('/').split('/')[-2]
-                
-                # Update status
-                self.result_queue.put(('status', partner_name, 'Scanning'))
-                
-                # Scan the partner
-                result = self.scan_partner(url, partner_name)
-                
-                # Send result to main thread
-                self.result_queue.put(('result', result))
-                
-                # Update progress
-                self.result_queue.put(('progress', i + 1))
-                
-                # Small delay between requests
-                time.sleep(0.5)
-            
-            # Scan completed
-            self.result_queue.put(('complete', None))
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for future in [executor.submit(self.scan_one, url, partner_name)
+                               for url, partner_name in self.partners]:
+                    future.result()
             
         except Exception as e:
             self.result_queue.put(('error', str(e)))
         finally:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
+            self.quit_drivers()
+            # Sent even after a stop or an error, so the partners scanned so far can be exported
+            self.result_queue.put(('complete', None))
+    
+    def scan_one(self, url: str, partner_name: str):
+        """Scan one partner on a pool thread and report back to the main thread"""
+        if not self.scanning:
+            return
+        
+        # Update status
+        self.result_queue.put(('status', partner_name, 'Scanning'))
+        
+        # Scan the partner, unless a recent result for the page is cached
+        result = self.load_cached_result(url, partner_name) if self.use_cache else None
+        if result is None:
+            result = self.scan_partner(url, partner_name)
+            if result.status == 'completed':
+                self.store_cached_result(result)
+        
+        # Send result and progress to main thread
+        with self.count_lock:
+            self.completed_count += 1
+            self.result_queue.put(('result', result))
+            self.result_queue.put(('progress', self.completed_count))
+    
+    def result_cache_path(self, url: str) -> Path:
+        """Cache file for a partner URL's parsed result"""
+        return RESULT_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+    
+    def load_cached_result(self, url: str, partner_name: str):
+        """Return the cached result for url if it is younger than RESULT_CACHE_TTL, else None"""
+        path = self.result_cache_path(url)
+        try:
+            if time.time() - path.stat().st_mtime > RESULT_CACHE_TTL:
+                return None
+            data = loads(path.read_bytes())
+            data['partner'] = partner_name
+            return ScanResult(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+    
+    def store_cached_result(self, result: ScanResult):
+        """Write a parsed result to the cache; failures only cost a rescan later"""
+        path = self.result_cache_path(result.url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+            tmp_path.write_bytes(dumps(asdict(result)))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+    
+    def fetch_page_http(self, url: str) -> str:
+        """Fetch a page's served HTML, or an empty string if the request fails"""
+        try:
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException:
+            return ""
+    
+    def render_page(self, url: str):
+        """Load a page in a pooled Chrome; returns (cards_html, has_cards)
+        
+        Only the outer domain cards' markup is pulled from the browser, not the
+        serialised page. WebDriver and browser connection failures are retried
+        with backoff, on a fresh driver if the browser died; the last failure
+        is raised.
+        """
+        for attempt in range(RENDER_ATTEMPTS):
+            try:
+                with self.checkout_driver() as driver:
+                    return self.read_cards(driver, url)
+            except _BROWSER_ERRORS:
+                if attempt == RENDER_ATTEMPTS - 1:
+                    raise
+                time.sleep(0.5 * 2 ** attempt)
+    
+    def read_cards(self, driver, url: str):
+        """Load url in driver and return (cards_html, has_cards)"""
+        driver.get(url)
+        
+        # Poll until the document is loaded and cards are in the DOM; a page
+        # with no cards after a few seconds has none
+        try:
+            WebDriverWait(driver, 3, poll_frequency=0.1).until(_cards_rendered)
+            has_cards = True
+        except TimeoutException:
+            has_cards = False
+        
+        if not has_cards:
+            return "", False
+        
+        # The first card can land before the rest; let the count settle
+        try:
+            WebDriverWait(driver, 2, poll_frequency=0.2).until(_card_count_stable())
+        except TimeoutException:
+            pass
+        return driver.execute_script(_CARDS_HTML_JS), True
+    
+    def parse_cards(self, html: str) -> List:
+        """Top-level domain cards in html; markup without the class name is not parsed"""
+        if 'domain-card' not in html:
+            return []
+        soup = BeautifulSoup(html, 'lxml', parse_only=_CARD_STRAINER)
+        return soup.find_all('div', class_='domain-card', recursive=False)
     
     def scan_partner(self, url: str, partner_name: str) -> ScanResult:
         """Scan a single partner page"""
         try:
-            self.driver.get(url)
-            
-            # Wait for domain cards
-            try:
-                WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "domain-card"))
-                )
-                time.sleep(1)
-                has_cards = True
-            except TimeoutException:
-                has_cards = False
-            
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            domain_cards = soup.find_all('div', class_='domain-card')
+            # Cards in the served HTML need no browser; if it yields none (the
+            # class name alone may appear in CSS or scripts), render the page
+            domain_cards = self.parse_cards(self.fetch_page_http(url))
+            if not domain_cards:
+                cards_html, has_cards = self.render_page(url)
+                if has_cards:
+                    domain_cards = self.parse_cards(cards_html)
             
-            if not has_cards or len(domain_cards) == 0:
+            if len(domain_cards) == 0:
                 return ScanResult(
                     partner=partner_name,
                     url=url,
@@ -335,16 +618,18 @@ class LiveDomainScanner:
     def extract_domain_info(self, card) -> Dict:
         """Extract domain information from a card"""
         try:
+            fields = _card_fields(card)
+            
             # Get domain name
-            domain_slug = card.find('div', class_='domain-slug')
-            domain_ending = card.find('strong', class_='domain-ending')
+            domain_slug = fields.get('slug')
+            domain_ending = fields.get('ending')
             
             domain_name = ""
             if domain_slug and domain_ending:
                 domain_name = domain_slug.text.strip() + domain_ending.text.strip()
             
             # Check button status
-            button = card.find('button', class_='add-to-cart')
+            button = fields.get('button')
             button_text = button.text.strip().lower() if button else ""
             button_classes = button.get('class', []) if button else []
             has_disabled = button.has_attr('disabled') if button else False
@@ -364,15 +649,15 @@ class LiveDomainScanner:
                 status = "sold" if is_sold_class else "available"
             
             # Get price
-            price_element = card.find('div', class_='price')
+            price_element = fields.get('price')
             price = ""
             price_numeric = 0
             if price_element:
                 price_text = price_element.text.strip()
-                price_match = re.search(r'\$(\d+)', price_text)
-                if price_match:
-                    price = f"${price_match.group(1)}"
-                    price_numeric = int(price_match.group(1))
+                digits = _price_digits(price_text)
+                if digits:
+                    price = f"${digits}"
+                    price_numeric = int(digits)
             
             return {
                 'domain': domain_name,
@@ -391,170 +676,212 @@ class LiveDomainScanner:
             }
     
     def process_results(self):
-        """Process results from the scanning thread"""
+        """Process results from the scanning thread
+        
+        Up to MAX_MESSAGES_PER_TICK queued messages are handled per tick, and
+        the summary is rebuilt at most once, however many results arrived.
+        """
+        handled = 0
         try:
-            while True:
+            while handled < MAX_MESSAGES_PER_TICK:
                 try:
-                    message_type, data, *extra = self.result_queue.get_nowait()
-                    
-                    if message_type == 'status':
-                        partner_name, status = data, extra[0]
-                        self.update_partner_status(partner_name, status)
-                        self.status_bar.config(text=f"Scanning {partner_name}...")
-                    
-                    elif message_type == 'result':
-                        result = data
-                        self.scan_results[result.partner] = result
-                        self.update_partner_result(result)
-                        self.update_summary()
-                    
-                    elif message_type == 'progress':
-                        progress = data
-                        self.progress['value'] = progress
-                        self.progress_label.config(text=f"{progress}/{len(self.partner_urls)}")
-                    
-                    elif message_type == 'complete':
-                        self.scan_completed()
-                    
-                    elif message_type == 'error':
-                        messagebox.showerror("Scan Error", f"An error occurred: {data}")
-                        self.stop_scan()
-                
-                except:
+                    message_type, *args = self.result_queue.get_nowait()
+                except Empty:
                     break
+                self.message_handlers[message_type](*args)
+                handled += 1
+            
+            self.flush_summary()
         
         finally:
-            # Schedule next check
-            self.root.after(100, self.process_results)
+            # Schedule next check; come straight back if the batch was cut
+            # short, and poll less often while idle
+            if handled >= MAX_MESSAGES_PER_TICK:
+                delay = 1
+            else:
+                delay = 100 if self.scanning else 200
+            self.root.after(delay, self.process_results)
+    
+    def flush_summary(self):
+        """Rebuild the summary panel if results arrived since it was last built"""
+        if self.summary_stale:
+            self.summary_stale = False
+            self.update_summary()
+    
+    def on_status_message(self, partner_name: str, status: str):
+        self.update_partner_status(partner_name, status)
+        self.status_bar.config(text=f"Scanning {partner_name}...")
+    
+    def on_result_message(self, result: ScanResult):
+        self.record_result(result)
+        self.update_partner_result(result)
+        self.summary_stale = True
+    
+    def on_progress_message(self, progress: int):
+        self.progress['value'] = progress
+        self.progress_label.config(text=f"{progress}/{len(self.partner_urls)}")
+    
+    def on_complete_message(self, _data):
+        # Bring the summary up to date before the modal dialog opens
+        self.flush_summary()
+        self.scan_completed()
+    
+    def on_error_message(self, error: str):
+        self.flush_summary()
+        messagebox.showerror("Scan Error", f"An error occurred: {error}")
+        self.stop_scan()
     
     def update_partner_status(self, partner_name: str, status: str):
         """Update partner status in the tree"""
-        for item in self.tree.get_children():
-            values = list(self.tree.item(item, 'values'))
-            if values[0] == partner_name:
-                values[1] = status
-                self.tree.item(item, values=values)
-                break
+        item = self.tree_items.get(partner_name)
+        if item is None:
+            return
+        values = list(self.tree.item(item, 'values'))
+        values[1] = status
+        self.tree.item(item, values=values)
     
     def update_partner_result(self, result: ScanResult):
         """Update partner result in the tree"""
-        for item in self.tree.get_children():
-            values = list(self.tree.item(item, 'values'))
-            if values[0] == result.partner:
-                if result.status == 'error':
-                    values[1] = "Error"
-                    values[2] = "-"
-                    values[3] = "-"
-                    values[4] = "-"
-                    values[5] = "-"
-                elif not result.has_domains:
-                    values[1] = "Complete"
-                    values[2] = "No"
-                    values[3] = "-"
-                    values[4] = "-"
-                    values[5] = "-"
-                else:
-                    values[1] = "Complete"
-                    values[2] = "Yes"
-                    values[3] = f"{result.sold_domains}/{result.total_domains}"
-                    values[4] = f"{result.percentage_sold:.1f}%"
-                    
-                    # Determine action needed
-                    if result.percentage_sold >= 90:
-                        values[5] = "High Priority"
-                    elif result.percentage_sold >= 50:
-                        values[5] = "Update Needed"
-                    else:
-                        values[5] = "OK"
-                
-                self.tree.item(item, values=values)
-                break
-    
-    def update_summary(self):
-        """Update the summary panel"""
-        completed_results = [r for r in self.scan_results.values() if r.status == 'completed']
-        with_domains = [r for r in completed_results if r.has_domains]
-        without_domains = [r for r in completed_results if not r.has_domains]
+        item = self.tree_items.get(result.partner)
+        if item is None:
+            return
+        values = list(self.tree.item(item, 'values'))
+        if result.status == 'error':
+            values[1] = "Error"
+            values[2] = "-"
+            values[3] = "-"
+            values[4] = "-"
+            values[5] = "-"
+        elif not result.has_domains:
+            values[1] = "Complete"
+            values[2] = "No"
+            values[3] = "-"
+            values[4] = "-"
+            values[5] = "-"
+        else:
+            values[1] = "Complete"
+            values[2] = "Yes"
+            values[3] = f"{result.sold_domains}/{result.total_domains}"
+            values[4] = f"{result.percentage_sold:.1f}%"
+            
+            # Determine action needed
+            if result.percentage_sold >= 90:
+                values[5] = "High Priority"
+            elif result.percentage_sold >= 50:
+                values[5] = "Update Needed"
+            else:
+                values[5] = "OK"
         
-        total_domains = sum(r.total_domains for r in with_domains)
-        total_sold = sum(r.sold_domains for r in with_domains)
-        total_value = sum(r.total_sold_value for r in with_domains)
+        self.tree.item(item, values=values)
+    
+    def reset_summary_totals(self):
+        """Zero the running totals behind the summary panel"""
+        self.summary_totals = dict.fromkeys(
+            ('completed', 'with_domains', 'without_domains', 'domains', 'sold', 'value', 'high_priority'), 0)
+        # Partner -> summary line, split at the 50% update threshold
+        self.needs_update_lines = {}
+        self.other_partner_lines = {}
+    
+    def record_result(self, result: ScanResult):
+        """Store a result and fold it into the summary totals"""
+        previous = self.scan_results.get(result.partner)
+        if previous is not None:
+            self.tally_result(previous, -1)
+        self.scan_results[result.partner] = result
+        self.tally_result(result, 1)
+    
+    def tally_result(self, result: ScanResult, sign: int):
+        """Add (sign=1) or remove (sign=-1) one result's share of the summary totals"""
+        if result.status != 'completed':
+            return
+        totals = self.summary_totals
+        totals['completed'] += sign
+        if not result.has_domains:
+            totals['without_domains'] += sign
+            return
         
-        needs_update = [r for r in with_domains if r.percentage_sold >= 50]
-        high_priority = [r for r in with_domains if r.percentage_sold >= 90]
+        totals['with_domains'] += sign
+        totals['domains'] += sign * result.total_domains
+        totals['sold'] += sign * result.sold_domains
+        totals['value'] += sign * result.total_sold_value
+        if result.percentage_sold >= 90:
+            totals['high_priority'] += sign
         
+        lines = self.needs_update_lines if result.percentage_sold >= 50 else self.other_partner_lines
+        if sign > 0:
+            lines[result.partner] = f"{result.partner.upper()}: {result.sold_domains}/{result.total_domains} ({result.percentage_sold:.1f}%)"
+        else:
+            lines.pop(result.partner, None)
+    
+    def update_summary(self):
+        """Update the summary panel from the running totals"""
+        totals = self.summary_totals
+        total_domains = totals['domains']
+        total_sold = totals['sold']
         sell_through = (total_sold / total_domains * 100) if total_domains > 0 else 0
         
-        summary = f"""SCAN PROGRESS: {len(completed_results)}/{len(self.partner_urls)}
+        parts = [f"""SCAN PROGRESS: {totals['completed']}/{len(self.partner_urls)}
 
 SUMMARY:
-• Total Partners: {len(completed_results)}
-• With Domains: {len(with_domains)}
-• Without Domains: {len(without_domains)}
+• Total Partners: {totals['completed']}
+• With Domains: {totals['with_domains']}
+• Without Domains: {totals['without_domains']}
 
 DOMAIN STATS:
 • Total Domains: {total_domains}
 • Total Sold: {total_sold}
 • Sell-through Rate: {sell_through:.1f}%
-• Total Value: ${total_value:,}
+• Total Value: ${totals['value']:,}
 
 ACTIONS NEEDED:
-• Updates Needed: {len(needs_update)}
-• High Priority: {len(high_priority)}
+• Updates Needed: {len(self.needs_update_lines)}
+• High Priority: {totals['high_priority']}
 
-PARTNERS NEEDING UPDATES:"""
+PARTNERS NEEDING UPDATES:"""]
         
         # Sort by partner name alphabetically
-        needs_update_sorted = sorted(needs_update, key=lambda r: r.partner.lower())
-        for r in needs_update_sorted:
-            summary += f"\n{r.partner.upper()}: {r.sold_domains}/{r.total_domains} ({r.percentage_sold:.1f}%)"
+        for partner in sorted(self.needs_update_lines, key=str.lower):
+            parts.append(self.needs_update_lines[partner])
         
         # Add all other partners with domains
-        other_partners = [r for r in with_domains if r.percentage_sold < 50]
-        if other_partners:
-            summary += f"\n\nALL OTHER PARTNERS:"
-            # Sort alphabetically
-            other_partners_sorted = sorted(other_partners, key=lambda r: r.partner.lower())
-            for r in other_partners_sorted:
-                summary += f"\n{r.partner.upper()}: {r.sold_domains}/{r.total_domains} ({r.percentage_sold:.1f}%)"
+        if self.other_partner_lines:
+            parts.append("\nALL OTHER PARTNERS:")
+            for partner in sorted(self.other_partner_lines, key=str.lower):
+                parts.append(self.other_partner_lines[partner])
         
-        self.summary_text.delete(1.0, tk.END)
-        self.summary_text.insert(1.0, summary)
+        self.summary_text.replace(1.0, tk.END, "\n".join(parts))
     
     def scan_completed(self):
-        """Handle scan completion"""
+        """Handle the scan worker finishing, whether the scan ran through or was stopped"""
+        stopped = not self.scanning
         self.scanning = False
         self.scan_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
         self.export_btn.config(state=tk.NORMAL)
         self.export_no_domains_btn.config(state=tk.NORMAL)
-        self.status_bar.config(text="Scan completed!")
+        self.status_bar.config(text=f"Scan stopped after {len(self.scan_results)} partners" if stopped else "Scan completed!")
         
         # Generate full scan data for export
         self.generate_full_scan_data()
         
-        messagebox.showinfo("Scan Complete", f"Scan completed! Processed {len(self.scan_results)} partners.")
+        if not stopped:
+            messagebox.showinfo("Scan Complete", f"Scan completed! Processed {len(self.scan_results)} partners.")
     
     def generate_full_scan_data(self):
         """Generate full scan data compatible with original format"""
-        completed_results = [r for r in self.scan_results.values() if r.status == 'completed']
-        with_domains = [r for r in completed_results if r.has_domains]
-        without_domains = [r for r in completed_results if not r.has_domains]
-        
-        total_domains = sum(r.total_domains for r in with_domains)
-        total_sold = sum(r.sold_domains for r in with_domains)
-        total_value = sum(r.total_sold_value for r in with_domains)
-        
-        needs_update = len([r for r in with_domains if r.percentage_sold >= 50])
-        high_priority = len([r for r in with_domains if r.percentage_sold >= 90])
-        
+        # The summary counts are the running totals kept for the summary panel
+        totals = self.summary_totals
+        total_domains = totals['domains']
+        total_sold = totals['sold']
         sell_through = (total_sold / total_domains * 100) if total_domains > 0 else 0
         
         # Convert to original format and sort alphabetically by partner name
         results = []
+        failed_scans = 0
         sorted_scan_results = sorted(self.scan_results.values(), key=lambda r: r.partner.lower())
         for result in sorted_scan_results:
             if result.status == 'error':
+                failed_scans += 1
                 results.append({
                     'partner': result.partner,
                     'url': result.url,
@@ -563,8 +890,15 @@ PARTNERS NEEDING UPDATES:"""
                     'has_premium_domains': False
                 })
             else:
-                sold_domains_list = [d for d in result.domains_data if d['status'] == 'sold']
-                available_domains_list = [d for d in result.domains_data if d['status'] == 'available']
+                # Split sold and available domains in one pass
+                sold_domains_list = []
+                available_domains_list = []
+                for d in result.domains_data:
+                    status = d['status']
+                    if status == 'sold':
+                        sold_domains_list.append(d)
+                    elif status == 'available':
+                        available_domains_list.append(d)
                 
                 # Determine update status
                 if not result.has_domains:
@@ -612,15 +946,15 @@ PARTNERS NEEDING UPDATES:"""
             'scan_timestamp': datetime.now().isoformat(),
             'summary': {
                 'total_partners_scanned': len(self.scan_results),
-                'successful_scans': len(completed_results),
-                'failed_scans': len([r for r in self.scan_results.values() if r.status == 'error']),
-                'pages_with_premium_domains': len(with_domains),
-                'pages_without_premium_domains': len(without_domains),
-                'partners_needing_update': needs_update,
-                'high_priority_updates': high_priority,
+                'successful_scans': totals['completed'],
+                'failed_scans': failed_scans,
+                'pages_with_premium_domains': totals['with_domains'],
+                'pages_without_premium_domains': totals['without_domains'],
+                'partners_needing_update': len(self.needs_update_lines),
+                'high_priority_updates': totals['high_priority'],
                 'total_domains_across_all_partners': total_domains,
                 'total_sold_across_all_partners': total_sold,
-                'total_sold_value': total_value,
+                'total_sold_value': totals['value'],
                 'overall_sell_through_rate': round(sell_through, 2)
             },
             'results': results
@@ -641,8 +975,8 @@ PARTNERS NEEDING UPDATES:"""
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.full_scan_data, f, indent=2, ensure_ascii=False)
+                with open(filename, 'wb') as f:
+                    f.write(dumps(self.full_scan_data, self.pretty_export.get()))
                 messagebox.showinfo("Export Success", f"Results exported to {filename}")
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
@@ -683,10 +1017,9 @@ PARTNERS NEEDING UPDATES:"""
         partner_name = self.tree.item(item, "values")[0]
         
         # Find the result and open URL
-        for result in self.scan_results.values():
-            if result.partner == partner_name:
-                webbrowser.open(result.url)
-                break
+        result = self.scan_results.get(partner_name)
+        if result:
+            webbrowser.open(result.url)
 
 def main():
     root = tk.Tk()
@@ -3,135 +3,156 @@ Partner URL configuration for domain scanners
 Shared between live_domain_scanner.py and domain_tracker.py
 """
 
-# URLs for partners that have already launched
-LAUNCHED_URLS = [
-    'https://get.unstoppabledomains.com/moon/',
-    'https://get.unstoppabledomains.com/u/',
-    'https://get.unstoppabledomains.com/quantum/',
-    'https://get.unstoppabledomains.com/onchain/',
-    'https://get.unstoppabledomains.com/ltc/',
-    'https://get.unstoppabledomains.com/her/',
-    'https://get.unstoppabledomains.com/xec/',
-    'https://get.unstoppabledomains.com/kpm/',
-    'https://get.unstoppabledomains.com/nibi/',
-    'https://get.unstoppabledomains.com/ask/',
-    'https://get.unstoppabledomains.com/south/',
-    'https://get.unstoppabledomains.com/calicoin/',
-    'https://get.unstoppabledomains.com/hegecoin/',
-    'https://get.unstoppabledomains.com/bobi/',
-    'https://get.unstoppabledomains.com/twin/',
-    'https://get.unstoppabledomains.com/mery/',
-    'https://get.unstoppabledomains.com/bch/',
-    'https://get.unstoppabledomains.com/mycircle/',
-    'https://get.unstoppabledomains.com/derad/',
-    'https://get.unstoppabledomains.com/sonic/',
-    'https://get.unstoppabledomains.com/pendle/',
-    'https://get.unstoppabledomains.com/dejay/',
-    'https://get.unstoppabledomains.com/xyo/',
-    'https://get.unstoppabledomains.com/swamp/',
-    'https://get.unstoppabledomains.com/pengu/',
-    'https://get.unstoppabledomains.com/hub/',
-    'https://get.unstoppabledomains.com/brave/',
-    'https://get.unstoppabledomains.com/ath/',
-    'https://get.unstoppabledomains.com/bunni/',
-    'https://get.unstoppabledomains.com/collect/',
-    'https://get.unstoppabledomains.com/housecoin/',
-    'https://get.unstoppabledomains.com/tigershark/',
-    'https://get.unstoppabledomains.com/arculus/',
-    'https://get.unstoppabledomains.com/pundi/',
-    'https://get.unstoppabledomains.com/ohm/',
-    'https://get.unstoppabledomains.com/cgai/',
-    'https://get.unstoppabledomains.com/anyone/',
-    'https://get.unstoppabledomains.com/dsci/',
-    'https://get.unstoppabledomains.com/chip/',
-    'https://get.unstoppabledomains.com/pokt/',
-    'https://get.unstoppabledomains.com/learn/',
-    'https://get.unstoppabledomains.com/pilot/',
-    'https://get.unstoppabledomains.com/gotchi/',
-    'https://get.unstoppabledomains.com/lunar/',
-    'https://get.unstoppabledomains.com/digibyte/',
-    'https://get.unstoppabledomains.com/mooncat/',
-    'https://get.unstoppabledomains.com/zano/',
-    'https://get.unstoppabledomains.com/agi/',
-    'https://get.unstoppabledomains.com/robot/',
-    'https://get.unstoppabledomains.com/pack/',
-    'https://get.unstoppabledomains.com/imtoken/',
-    'https://get.unstoppabledomains.com/troll/',
-    'https://get.unstoppabledomains.com/web3/',
-    'https://get.unstoppabledomains.com/supernova/',
-    'https://get.unstoppabledomains.com/demos/',
-    'https://get.unstoppabledomains.com/pbdx/',
-    'https://get.unstoppabledomains.com/carbon/',
-    'https://get.unstoppabledomains.com/presearch/',
-    'https://get.unstoppabledomains.com/ai4/',
-    'https://get.unstoppabledomains.com/goblin/',
-    'https://get.unstoppabledomains.com/undeads/',
-    'https://get.unstoppabledomains.com/marketer/',
-    'https://get.unstoppabledomains.com/amp/',
-    'https://get.unstoppabledomains.com/mobix/',
-    'https://get.unstoppabledomains.com/aura/',
-    'https://get.unstoppabledomains.com/agent/',
-    'https://get.unstoppabledomains.com/openx/',
-    'https://get.unstoppabledomains.com/yellow/',
-    'https://get.unstoppabledomains.com/verge/',
-]
+_BASE_URL = 'https://get.unstoppabledomains.com/'
 
-# URLs for partners that have not yet launched
-NOT_LAUNCHED_URLS = [
-    'https://get.unstoppabledomains.com/cashme/',
-    'https://get.unstoppabledomains.com/enigma/',
-    'https://get.unstoppabledomains.com/taxbit/',
-    'https://get.unstoppabledomains.com/digitalfuture/', # not yet made
-    'https://get.unstoppabledomains.com/birb/',
-    'https://get.unstoppabledomains.com/lambo/',
-    'https://get.unstoppabledomains.com/horizen/',
-    'https://get.unstoppabledomains.com/kalshi/',
-    'https://get.unstoppabledomains.com/etoro/',
-    'https://get.unstoppabledomains.com/sweat/',
-    'https://get.unstoppabledomains.com/chaingpt/',
-    'https://get.unstoppabledomains.com/payfi/',
-    'https://get.unstoppabledomains.com/momentum/',
-    'https://get.unstoppabledomains.com/wsb/', # not yet made
-    'https://get.unstoppabledomains.com/magnus/',
-    'https://get.unstoppabledomains.com/phoenix/',
-    'https://get.unstoppabledomains.com/bome/', # not yet made
-    'https://get.unstoppabledomains.com/giga/',
-    'https://get.unstoppabledomains.com/stable/',
-    'https://get.unstoppabledomains.com/paypal/',
-    'https://get.unstoppabledomains.com/inch/',
-    'https://get.unstoppabledomains.com/pump/',
-    'https://get.unstoppabledomains.com/frog/',
-    'https://get.unstoppabledomains.com/lumiterra/',
-    'https://get.unstoppabledomains.com/mask/',
-    'https://get.unstoppabledomains.com/robinhood/',
-    'https://get.unstoppabledomains.com/00/', # not yet made
-    'https://get.unstoppabledomains.com/namaste/',
-    'https://get.unstoppabledomains.com/paypal/',
-    'https://get.unstoppabledomains.com/gram/',
-    'https://get.unstoppabledomains.com/payment/',
-    'https://get.unstoppabledomains.com/santa/',
-    'https://get.unstoppabledomains.com/card3/',
-    'https://get.unstoppabledomains.com/kadena/',
-    'https://get.unstoppabledomains.com/bitmart/',
-    'https://get.unstoppabledomains.com/huddleone/',
-    'https://get.unstoppabledomains.com/bird/',
-    'https://get.unstoppabledomains.com/mintify/',
-    'https://get.unstoppabledomains.com/cpool/',
-    'https://get.unstoppabledomains.com/degn/',
-    'https://get.unstoppabledomains.com/coca/',
-    'https://get.unstoppabledomains.com/rocketpool/',
-    'https://get.unstoppabledomains.com/kaspa/',
-    'https://get.unstoppabledomains.com/etc/',
-    'https://get.unstoppabledomains.com/cfx/',
-    'https://get.unstoppabledomains.com/wolf/',
-    'https://get.unstoppabledomains.com/xlayer/',
-    'https://get.unstoppabledomains.com/zbu/',
-    'https://get.unstoppabledomains.com/zeebu/',
-    'https://get.unstoppabledomains.com/okx/',
-    'https://get.unstoppabledomains.com/kubchain/',
-    'https://get.unstoppabledomains.com/fablo/',
-    'https://get.unstoppabledomains.com/tornadocash/',
-]
+# Every partner as (subpage slug, launched). The page URL is _BASE_URL + slug + '/';
+# not-yet-launched partners are only scanned when asked for
+PARTNERS = (
+    # Launched
+    ('moon', True),
+    ('u', True),
+    ('quantum', True),
+    ('onchain', True),
+    ('ltc', True),
+    ('her', True),
+    ('xec', True),
+    ('kpm', True),
+    ('nibi', True),
+    ('ask', True),
+    ('south', True),
+    ('calicoin', True),
+    ('hegecoin', True),
+    ('bobi', True),
+    ('twin', True),
+    ('mery', True),
+    ('bch', True),
+    ('mycircle', True),
+    ('derad', True),
+    ('sonic', True),
+    ('pendle', True),
+    ('dejay', True),
+    ('xyo', True),
+    ('swamp', True),
+    ('pengu', True),
+    ('hub', True),
+    ('brave', True),
+    ('ath', True),
+    ('bunni', True),
+    ('collect', True),
+    ('housecoin', True),
+    ('tigershark', True),
+    ('arculus', True),
+    ('pundi', True),
+    ('ohm', True),
+    ('cgai', True),
+    ('anyone', True),
+    ('dsci', True),
+    ('chip', True),
+    ('pokt', True),
+    ('learn', True),
+    ('pilot', True),
+    ('gotchi', True),
+    ('lunar', True),
+    ('digibyte', True),
+    ('mooncat', True),
+    ('zano', True),
+    ('agi', True),
+    ('robot', True),
+    ('pack', True),
+    ('imtoken', True),
+    ('troll', True),
+    ('web3', True),
+    ('supernova', True),
+    ('demos', True),
+    ('pbdx', True),
+    ('carbon', True),
+    ('presearch', True),
+    ('ai4', True),
+    ('goblin', True),
+    ('undeads', True),
+    ('marketer', True),
+    ('amp', True),
+    ('mobix', True),
+    ('aura', True),
+    ('agent', True),
+    ('openx', True),
+    ('yellow', True),
+    ('verge', True),
+
+    # Not yet launched
+    ('cashme', False),
+    ('enigma', False),
+    ('taxbit', False),
+    ('digitalfuture', False), # not yet made
+    ('birb', False),
+    ('lambo', False),
+    ('horizen', False),
+    ('kalshi', False),
+    ('etoro', False),
+    ('sweat', False),
+    ('chaingpt', False),
+    ('payfi', False),
+    ('momentum', False),
+    ('wsb', False), # not yet made
+    ('magnus', False),
+    ('phoenix', False),
+    ('bome', False), # not yet made
+    ('giga', False),
+    ('stable', False),
+    ('paypal', False),
+    ('inch', False),
+    ('pump', False),
+    ('frog', False),
+    ('lumiterra', False),
+    ('mask', False),
+    ('robinhood', False),
+    ('00', False), # not yet made
+    ('namaste', False),
+    ('gram', False),
+    ('payment', False),
+    ('santa', False),
+    ('card3', False),
+    ('kadena', False),
+    ('bitmart', False),
+    ('huddleone', False),
+    ('bird', False),
+    ('mintify', False),
+    ('cpool', False),
+    ('degn', False),
+    ('coca', False),
+    ('rocketpool', False),
+    ('kaspa', False),
+    ('etc', False),
+    ('cfx', False),
+    ('wolf', False),
+    ('xlayer', False),
+    ('zbu', False),
+    ('zeebu', False),
+    ('okx', False),
+    ('kubchain', False),
+    ('fablo', False),
+    ('tornadocash', False),
+)
+
+
+# Each partner slug appears once; a slug listed twice fails here at import
+assert len({slug for slug, _ in PARTNERS}) == len(PARTNERS), "duplicate partner slug in PARTNERS"
+
+
+def _sorted_urls(include_not_launched):
+    """URLs of the selected partners, sorted alphabetically by slug"""
+    slugs = [slug for slug, launched in PARTNERS if launched or include_not_launched]
+    return tuple(f'{_BASE_URL}{slug}/' for slug in sorted(slugs, key=str.lower))
+
+
+# PARTNERS never changes at runtime, so both answers are built once
+_SORTED_LAUNCHED = _sorted_urls(False)
+_SORTED_ALL = _sorted_urls(True)
+
+# Partner URLs as sets, for `url in LAUNCHED_SET` style membership checks
+LAUNCHED_SET = frozenset(_SORTED_LAUNCHED)
+ALL_URLS_SET = frozenset(_SORTED_ALL)
+NOT_LAUNCHED_SET = ALL_URLS_SET - LAUNCHED_SET
 
 
 def get_all_urls(include_not_launched=False):
@@ -144,23 +165,4 @@ def get_all_urls(include_not_launched=False):
     Returns:
         List of partner URLs, sorted alphabetically by subpage
     """
-    urls = LAUNCHED_URLS.copy()
-    
-    if include_not_launched:
-        urls.extend(NOT_LAUNCHED_URLS)
-    
-    # Remove duplicates
-    urls = list(dict.fromkeys(urls))
-    
-    # Sort alphabetically by subpage name
-    def get_subpage(url):
-        """Extract subpage name from URL"""
-        name = url.rstrip('/').split('/')[-1]
-        if not name:
-            name = url.rstrip('/').split('/')[-2]
-        return name.lower()
-    
-    urls.sort(key=get_subpage)
-    
-    return urls
-
+    return list(_SORTED_ALL if include_not_launched else _SORTED_LAUNCHED)
@@ -6,7 +6,11 @@ Fetches partner URLs from a Google Sheet for easy team management
 
 import os
 import json
-from typing import List, Tuple
+import functools
+import logging
+import time
+from itertools import zip_longest
+from typing import Dict, List, Tuple
 
 # Try to import Google Sheets dependencies
 try:
@@ -17,9 +21,19 @@ except ImportError:
     SHEETS_AVAILABLE = False
 
 
+log = logging.getLogger(__name__)
+
+
 # Configuration - Update these values
 SPREADSHEET_ID = os.environ.get('GOOGLE_SHEET_ID', '')
-SHEET_RANGE = 'A:B'  # Column A = URL, Column B = Status (launched/not_launched)
+URL_RANGE = 'A2:A'     # Column A = URL, below the header row
+STATUS_RANGE = 'B2:B'  # Column B = Status (launched/not_launched)
+
+# Sheet contents are reused for this many seconds instead of calling the API again
+SHEET_CACHE_TTL = int(os.environ.get('SHEET_CACHE_TTL', '300'))
+
+# (spreadsheet id, url range, status range) -> (time.monotonic() of the fetch, (urls, statuses))
+_CACHE: Dict[Tuple[str, str, str], Tuple[float, Tuple[List[str], List[str]]]] = {}
 
 
 def get_urls_from_sheet(include_not_launched: bool = False) -> List[str]:
@@ -50,51 +64,29 @@ def get_urls_from_sheet(include_not_launched: bool = False) -> List[str]:
             "Set it to your Google Sheet ID (from the URL)."
         )
     
-    # Get credentials from environment or file
-    creds = _get_credentials()
-    
-    # Build the Sheets API service
-    service = build('sheets', 'v4', credentials=creds)
-    sheet = service.spreadsheets()
-    
-    # Fetch data
-    result = sheet.values().get(
-        spreadsheetId=SPREADSHEET_ID,
-        range=SHEET_RANGE
-    ).execute()
+    url_column, status_column = _fetch_columns()
     
-    values = result.get('values', [])
-    
-    if not values:
+    if not url_column and not status_column:
         print("⚠️  No data found in sheet")
         return []
     
-    # Skip header row, parse URLs
-    urls = []
-    for row in values[1:]:  # Skip header
-        if not row:
-            continue
-            
-        url = row[0].strip() if len(row) > 0 else ''
-        status = row[1].strip().lower() if len(row) > 1 else 'launched'
-        
-        if not url:
-            continue
-            
-        # Ensure URL ends with /
-        if not url.endswith('/'):
-            url += '/'
-        
-        # Filter by status
-        if status == 'not_launched' and not include_not_launched:
-            continue
-            
-        urls.append(url)
+    # The API trims trailing blanks from each column, so pad the shorter one;
+    # a missing status means launched. Unformatted cells may be numbers
+    parsed = (
+        (str(url).strip(), str(status).strip().lower())
+        for url, status in zip_longest(url_column, status_column, fillvalue='')
+    )
+    
+    # Drop blank URLs, filter by status and ensure each URL ends with /
+    urls = [
+        url if url.endswith('/') else url + '/'
+        for url, status in parsed
+        if url and (include_not_launched or status != 'not_launched')
+    ]
     
     # Sort alphabetically by partner name
     def get_partner_name(url):
-        name = url.rstrip('/').split('/')[-1]
-        return name.lower()
+        return url.rstrip('/').rpartition('/')[2].lower()
     
     urls.sort(key=get_partner_name)
     
@@ -102,28 +94,80 @@ def get_urls_from_sheet(include_not_launched: bool = False) -> List[str]:
     return urls
 
 
+def _fetch_columns() -> Tuple[List[str], List[str]]:
+    """Fetch the URL and status columns, reusing a fetch younger than SHEET_CACHE_TTL"""
+    key = (SPREADSHEET_ID, URL_RANGE, STATUS_RANGE)
+    cached = _CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < SHEET_CACHE_TTL:
+        return cached[1]
+    
+    # Get credentials from environment or file, and the Sheets API service
+    service = _get_service(_get_credentials())
+    sheet = service.spreadsheets()
+    
+    # Fetch both columns in one request, each as a flat list of raw cell
+    # values, and ask for nothing but the values in the response
+    result = sheet.values().batchGet(
+        spreadsheetId=SPREADSHEET_ID,
+        ranges=[URL_RANGE, STATUS_RANGE],
+        majorDimension='COLUMNS',
+        valueRenderOption='UNFORMATTED_VALUE',
+        fields='valueRanges(values)'
+    ).execute()
+    
+    url_range, status_range = result.get('valueRanges', [{}, {}])
+    columns = (url_range.get('values', [[]])[0], status_range.get('values', [[]])[0])
+    _CACHE[key] = (time.monotonic(), columns)
+    return columns
+
+
+@functools.lru_cache(maxsize=1)
+def _get_service(creds):
+    """Build the Sheets API service once per credentials object
+    
+    The discovery document bundled with google-api-python-client is used, so
+    building needs no network fetch and no discovery file cache.
+    """
+    return build('sheets', 'v4', credentials=creds, cache_discovery=False, static_discovery=True)
+
+
 def _get_credentials():
     """Get Google API credentials from environment or file"""
+    return _load_credentials(
+        os.environ.get('GOOGLE_CREDENTIALS_JSON'),
+        os.environ.get('GOOGLE_CREDENTIALS_FILE', 'credentials.json')
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _load_credentials(creds_json, creds_file):
+    """Parse credentials once per (JSON, file path) setting; the key parse is expensive"""
     
     # Option 1: Credentials JSON in environment variable (for GitHub Actions)
-    creds_json = os.environ.get('GOOGLE_CREDENTIALS_JSON')
     if creds_json:
         try:
-            # Clean up the JSON string - handle potential formatting issues
-            creds_json = creds_json.strip()
-            
-            # Remove BOM if present
-            if creds_json.startswith('\ufeff'):
-                creds_json = creds_json[1:]
-            
-            # Handle if the JSON was accidentally wrapped in extra quotes
-            if creds_json.startswith('"') and creds_json.endswith('"'):
-                creds_json = creds_json[1:-1]
-                # Unescape if it was double-escaped
-                creds_json = creds_json.replace('\\"', '"').replace('\\n', '\n')
+            # Well-formed JSON, the usual case, parses as-is
+            try:
+                creds_data = json.loads(creds_json)
+            except json.JSONDecodeError:
+                creds_data = None
             
-            # Try to parse the JSON
-            creds_data = json.loads(creds_json)
+            if not isinstance(creds_data, dict):
+                # Clean up the JSON string - handle potential formatting issues
+                creds_json = creds_json.strip()
+                
+                # Remove BOM if present
+                if creds_json.startswith('\ufeff'):
+                    creds_json = creds_json[1:]
+                
+                # Handle if the JSON was accidentally wrapped in extra quotes
+                if creds_json.startswith('"') and creds_json.endswith('"'):
+                    creds_json = creds_json[1:-1]
+                    # Unescape if it was double-escaped
+                    creds_json = creds_json.replace('\\"', '"').replace('\\n', '\n')
+                
+                # Try to parse the cleaned-up JSON
+                creds_data = json.loads(creds_json)
             
             return Credentials.from_service_account_info(
                 creds_data,
@@ -132,9 +176,9 @@ def _get_credentials():
         except json.JSONDecodeError as e:
             # Provide helpful debug info
             print(f"❌ Failed to parse GOOGLE_CREDENTIALS_JSON: {e}")
-            print(f"   JSON length: {len(creds_json)} chars")
-            print(f"   Starts with: {repr(creds_json[:20])}")
-            print(f"   Ends with: {repr(creds_json[-20:])}")
+            # Fragments of the secret only appear when debug logging is enabled
+            log.debug("GOOGLE_CREDENTIALS_JSON length=%d start=%r end=%r",
+                      len(creds_json), creds_json[:20], creds_json[-20:])
             raise ValueError(
                 f"Invalid JSON in GOOGLE_CREDENTIALS_JSON secret. "
                 f"Make sure you copied the ENTIRE contents of the JSON key file "
@@ -142,7 +186,6 @@ def _get_credentials():
             )
     
     # Option 2: Credentials file path
-    creds_file = os.environ.get('GOOGLE_CREDENTIALS_FILE', 'credentials.json')
     if os.path.exists(creds_file):
         return Credentials.from_service_account_file(
             creds_file,
@@ -173,5 +216,8 @@ def test_connection():
 
 
 if __name__ == "__main__":
+    # The connection test is the place to see credential diagnostics
+    logging.basicConfig(format='   %(message)s')
+    log.setLevel(logging.DEBUG)
     print("🔗 Testing Google Sheets connection...")
     test_connection()